@@ -9,6 +9,7 @@ from aiso_core.dependencies import get_current_user
 from aiso_core.models.user import User
 from aiso_core.schemas.file_system import (
     BatchUpdateDesktopPositionsRequest,
+    BulkCreateRequest,
     BulkDeleteRequest,
     BulkMoveRequest,
     BulkResultResponse,
@@ -17,6 +18,7 @@ from aiso_core.schemas.file_system import (
     CreateNodeRequest,
     DeleteNodeRequest,
     DirectoryListingResponse,
+    EmptyTrashResponse,
     FileNodeResponse,
     FileNodeTreeResponse,
     MoveNodeRequest,
@@ -153,6 +155,17 @@ async def delete_node(
     return await service.delete_node(current_user.id, data)
 
 
+@router.post("/bulk-create", response_model=BulkResultResponse)
+async def bulk_create(
+    data: BulkCreateRequest,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    container_name = await _ensure_container_running(current_user)
+    service = _get_service(db, container_name)
+    return await service.bulk_create(current_user.id, data)
+
+
 @router.post("/bulk-delete", response_model=BulkResultResponse)
 async def bulk_delete(
     data: BulkDeleteRequest,
@@ -196,7 +209,7 @@ async def restore_node(
     return await service.restore_node(current_user.id, data)
 
 
-@router.post("/empty-trash")
+@router.post("/empty-trash", response_model=EmptyTrashResponse)
 async def empty_trash(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
@@ -204,7 +217,7 @@ async def empty_trash(
     container_name = await _ensure_container_running(current_user)
     service = _get_service(db, container_name)
     count = await service.empty_trash(current_user.id)
-    return {"deleted": count}
+    return EmptyTrashResponse(deleted=count)
 
 
 @router.patch("/desktop-positions", response_model=list[FileNodeResponse])
@@ -1,7 +1,7 @@
 import secrets
 from pathlib import Path
 
-from pydantic import model_validator
+from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 # Path to aiso-core/ directory (src/aiso_core/config.py -> 2 levels up -> aiso-core/)
@@ -35,6 +35,7 @@ class Settings(BaseSettings):
     secret_key: str = _INSECURE_DEFAULT_KEY
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 1440
+    bcrypt_rounds: int = Field(default=12, ge=4, le=31)
 
     @model_validator(mode="after")
     def _validate_secret_key(self) -> "Settings":
@@ -2,13 +2,15 @@ from contextlib import asynccontextmanager
 from pathlib import Path
 
 import sentry_sdk
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from aiso_core.api.router import api_router
 from aiso_core.api.v1.terminal import router as terminal_ws_router
 from aiso_core.config import settings
+from aiso_core.services.container_fs_service import PathTraversalError
 
 if settings.sentry_dsn and settings.environment == "production":
     sentry_sdk.init(
@@ -90,6 +92,13 @@ def create_app() -> FastAPI:
     upload_path.mkdir(parents=True, exist_ok=True)
     app.mount("/uploads", StaticFiles(directory=upload_path), name="uploads")
 
+    @app.exception_handler(PathTraversalError)
+    async def _path_traversal_handler(_request: Request, exc: PathTraversalError) -> JSONResponse:
+        return JSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content={"detail": str(exc)},
+        )
+
     app.include_router(api_router, prefix="/api")
     app.include_router(terminal_ws_router, prefix="/ws")
 
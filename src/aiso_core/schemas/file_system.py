@@ -50,6 +50,10 @@ class RestoreNodeRequest(BaseModel):
     path: str
 
 
+class BulkCreateRequest(BaseModel):
+    nodes: list[CreateNodeRequest]
+
+
 class BulkDeleteRequest(BaseModel):
     paths: list[str]
     permanent: bool = False
@@ -126,6 +130,10 @@ class BulkResultResponse(BaseModel):
     failed: list[BulkResultItem]
 
 
+class EmptyTrashResponse(BaseModel):
+    deleted: int
+
+
 # ── File content schemas ──
 
 
@@ -9,6 +9,7 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import re
 import shlex
 
 from fastapi import HTTPException, status
@@ -173,13 +174,17 @@ def _get_docker_client():  # noqa: ANN202
     return get_docker_client()
 
 
+class PathTraversalError(ValueError):
+    """VFS path contains a '..' segment. Translated to 400 by the app's exception handler."""
+
+
+_DOTDOT = re.compile(r"(?:^|/)\.\.(?:/|$)")
+
+
 def _validate_path(vfs_path: str) -> None:
     """Prevent path traversal attacks."""
-    if ".." in vfs_path.split("/"):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Path must not contain '..' segments",
-        )
+    if _DOTDOT.search(vfs_path):
+        raise PathTraversalError("Path must not contain '..' segments")
 
 
 class ContainerFsService:
@@ -188,20 +193,21 @@ class ContainerFsService:
     def __init__(self, container_name: str, base_path: str = "/home/aisu"):
         self.container_name = container_name
         self.base_path = base_path
+        self._prefix = base_path.rstrip("/") + "/"
 
     def _vfs_to_container(self, vfs_path: str) -> str:
         """Convert VFS path to an absolute path inside the container."""
         _validate_path(vfs_path)
         if vfs_path == "/":
             return self.base_path
-        return self.base_path + vfs_path
+        return self._prefix + vfs_path.lstrip("/")
 
     def _container_to_vfs(self, container_path: str) -> str:
         """Convert container absolute path to a VFS path."""
-        if container_path == self.base_path or container_path == self.base_path + "/":
+        if container_path == self.base_path or container_path == self._prefix:
             return "/"
-        if container_path.startswith(self.base_path + "/"):
-            return container_path[len(self.base_path) :]
+        if container_path.startswith(self._prefix):
+            return "/" + container_path[len(self._prefix) :]
         return container_path
 
     async def _exec_cmd(self, cmd: list[str]) -> tuple[str, int]:
@@ -16,6 +16,9 @@ from aiso_core.models.user_container import UserContainer
 
 logger = logging.getLogger(__name__)
 
+# Standard home subdirectories created for every user.
+_DEFAULT_SUBDIRS = ("Desktop", "Documents", "Downloads", "Pictures", "Music", "Videos", ".Trash")
+
 
 def _parse_mem_str(mem_str: str) -> int:
     """Convert memory string to bytes (e.g. '1g' -> 1073741824)."""
@@ -46,8 +49,7 @@ def _create_user_dirs(user_id: uuid.UUID) -> str:
     container entrypoint from /etc/aisu-skel.
     """
     base = _get_user_data_path(user_id)
-    subdirs = ["Desktop", "Documents", "Downloads", "Pictures", "Music", "Videos", ".Trash"]
-    for subdir in subdirs:
+    for subdir in _DEFAULT_SUBDIRS:
         os.makedirs(os.path.join(base, subdir), exist_ok=True)
     return base
 
@@ -17,8 +17,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from aiso_core.models.file_system_node import FileSystemNode
 from aiso_core.schemas.file_system import (
     BatchUpdateDesktopPositionsRequest,
+    BulkCreateRequest,
     BulkDeleteRequest,
     BulkMoveRequest,
+    BulkResultItem,
     BulkResultResponse,
     CopyNodeRequest,
     CopyResultResponse,
@@ -35,7 +37,7 @@ from aiso_core.schemas.file_system import (
     WriteFileResponse,
     path_to_uuid,
 )
-from aiso_core.services.container_fs_service import ContainerFsService
+from aiso_core.services.container_fs_service import ContainerFsService, PathTraversalError
 
 
 def _ts_from_epoch(epoch: float) -> datetime:
@@ -558,6 +560,23 @@ class FileSystemService:
 
         return response
 
+    async def bulk_create(self, user_id: uuid.UUID, data: BulkCreateRequest) -> BulkResultResponse:
+        """Create multiple files/directories."""
+        succeeded: list[str] = []
+        failed: list[BulkResultItem] = []
+
+        for node in data.nodes:
+            path = f"/{node.name}" if node.parent_path == "/" else f"{node.parent_path}/{node.name}"
+            try:
+                created = await self.create_node(user_id, node)
+                succeeded.append(created.path)
+            except HTTPException as e:
+                failed.append(BulkResultItem(path=path, error=e.detail))
+            except PathTraversalError as e:
+                failed.append(BulkResultItem(path=path, error=str(e)))
+
+        return BulkResultResponse(succeeded=succeeded, failed=failed)
+
     async def bulk_delete(self, user_id: uuid.UUID, data: BulkDeleteRequest) -> BulkResultResponse:
         """Delete multiple files."""
         succeeded: list[str] = []
@@ -571,6 +590,8 @@ class FileSystemService:
                 succeeded.append(path)
             except HTTPException as e:
                 failed.append({"path": path, "error": e.detail})
+            except PathTraversalError as e:
+                failed.append({"path": path, "error": str(e)})
 
         return BulkResultResponse(
             succeeded=succeeded,
@@ -591,6 +612,8 @@ class FileSystemService:
                 succeeded.append(path)
             except HTTPException as e:
                 failed.append({"path": path, "error": e.detail})
+            except PathTraversalError as e:
+                failed.append({"path": path, "error": str(e)})
 
         return BulkResultResponse(
             succeeded=succeeded,
@@ -1,11 +1,20 @@
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterator
 from pathlib import Path
 
 import pytest
+import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.pool import StaticPool
 
 from aiso_core.config import settings
 from aiso_core.database import get_db
@@ -21,9 +30,19 @@ from aiso_core.models.user import User
 from aiso_core.models.user_container import UserContainer
 from aiso_core.models.user_session import UserSession
 from aiso_core.services.beta_access_service import BetaAccessService
+from aiso_core.services.container_fs_service import _validate_path
+from aiso_core.services.container_service import _DEFAULT_SUBDIRS
 from aiso_core.utils.rate_limiter import get_rate_limiter
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _fast_password_hashing() -> Iterator[None]:
+    # bcrypt's minimum cost: hashes stay real, but cost ~1ms instead of ~250ms.
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(settings, "bcrypt_rounds", 4)
+        yield
+
+
 @compiles(UUID, "sqlite")
 def _compile_uuid_sqlite(element: UUID, compiler, **kw) -> str:  # type: ignore[no-untyped-def]
     return "CHAR(32)"
@@ -39,14 +58,31 @@ def _compile_array_sqlite(element: ARRAY, compiler, **kw) -> str:  # type: ignor
     return "JSON"
 
 
-@pytest.fixture
-async def db_engine(tmp_path_factory) -> AsyncGenerator:
-    db_dir = tmp_path_factory.mktemp("db")
-    db_path = db_dir / "test.db"
+def _sqlite_savepoint_support(engine: AsyncEngine) -> None:
+    """Let SQLAlchemy, not pysqlite, emit BEGIN so SAVEPOINTs nest correctly."""
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _do_connect(dbapi_connection, _connection_record) -> None:  # type: ignore[no-untyped-def]
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _do_begin(conn) -> None:  # type: ignore[no-untyped-def]
+        conn.exec_driver_sql("BEGIN")
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def db_engine() -> AsyncGenerator[AsyncEngine, None]:
+    """One in-memory engine and schema per session (per xdist worker)."""
     engine = create_async_engine(
-        f"sqlite+aiosqlite:///{db_path}",
+        "sqlite+aiosqlite:///:memory:",
+        # A single shared connection keeps the in-memory database alive for the session.
+        poolclass=StaticPool,
         connect_args={"check_same_thread": False},
+        echo=False,
+        # The whole session shares this engine; keep every compiled statement.
+        query_cache_size=1200,
     )
+    _sqlite_savepoint_support(engine)
     async with engine.begin() as conn:
         await conn.run_sync(lambda sync_conn: User.__table__.create(sync_conn, checkfirst=True))
         await conn.run_sync(
@@ -80,14 +116,27 @@ async def db_engine(tmp_path_factory) -> AsyncGenerator:
         await engine.dispose()
 
 
+@pytest.fixture
+async def db_connection(db_engine: AsyncEngine) -> AsyncGenerator[AsyncConnection, None]:
+    """Connection holding an outer transaction that is rolled back after each test."""
+    async with db_engine.connect() as conn:
+        trans = await conn.begin()
+        try:
+            yield conn
+        finally:
+            await trans.rollback()
+
+
 @pytest.fixture
 async def async_session_factory(
-    db_engine,
+    db_connection: AsyncConnection,
 ) -> AsyncGenerator[async_sessionmaker[AsyncSession], None]:
+    # Sessions join the per-test transaction; their commits release a SAVEPOINT.
     yield async_sessionmaker(
-        db_engine,
+        db_connection,
         class_=AsyncSession,
         expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
     )
 
 
@@ -114,6 +163,7 @@ class _LocalFsService:
     # -- path helpers --
 
     def _vfs_to_container(self, vfs_path: str) -> str:
+        _validate_path(vfs_path)
         if vfs_path == "/":
             return self.base_path
         return self.base_path + vfs_path
@@ -415,21 +465,32 @@ _fs_roots: dict[str, str] = {}
 def _make_local_fs_service(tmp_base: str):
     """Factory: wrapper that returns a LocalFsService based on container_name."""
 
-    original_init = _LocalFsService.__init__
+    # Subclass rather than patching _LocalFsService.__init__ in place: patches would
+    # stack across tests and every later test would resolve to the first test's root.
+    class _SeededLocalFsService(_LocalFsService):
+        def __init__(self, container_name: str, base_path: str = "/home/aisu"):
+            super().__init__(container_name, base_path)
+            if container_name not in _fs_roots:
+                user_dir = Path(tmp_base) / container_name
+                for d in _DEFAULT_SUBDIRS:
+                    (user_dir / d).mkdir(parents=True, exist_ok=True)
+                _fs_roots[container_name] = str(user_dir)
+            self.base_path = _fs_roots[container_name]
 
-    def _patched_init(self, container_name: str, base_path: str = "/home/aisu"):
-        original_init(self, container_name, base_path)
-        if container_name not in _fs_roots:
-            user_dir = Path(tmp_base) / container_name
-            for d in ["Desktop", "Documents", "Downloads", "Pictures", "Music", "Videos", ".Trash"]:
-                (user_dir / d).mkdir(parents=True, exist_ok=True)
-            _fs_roots[container_name] = str(user_dir)
-        self.base_path = _fs_roots[container_name]
+    return _SeededLocalFsService
 
-    _LocalFsService.__init__ = _patched_init  # type: ignore[assignment]
+
+@pytest.fixture(scope="session")
+def local_fs_cls() -> type[_LocalFsService]:
+    """The local file system ContainerFsService stand-in, for tests that build their own."""
     return _LocalFsService
 
 
+# Requests are dispatched straight into the app, no sockets involved. The transport
+# keeps no per-client state, so one instance serves every test.
+_ASGI_TRANSPORT = ASGITransport(app=app, raise_app_exceptions=True)
+
+
 @pytest.fixture
 async def client(
     async_session_factory: async_sessionmaker[AsyncSession],
@@ -477,7 +538,6 @@ async def client(
                 raise
 
     app.dependency_overrides[get_db] = override_get_db
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+    async with AsyncClient(transport=_ASGI_TRANSPORT, base_url="http://testserver") as ac:
         yield ac
     app.dependency_overrides.clear()
@@ -10,6 +10,7 @@ from aiso_core.config import settings
 from aiso_core.services.caddy_service import CaddyError, CaddyService
 
 
+@pytest.mark.fast
 class TestCaddyServiceDisabled:
     """All methods are no-op when caddy_admin_url is empty."""
 
@@ -1,88 +1,115 @@
 """ContainerFsService unit tests.
 
-No Docker required — uses _LocalFsService from conftest.py,
+No Docker required — uses _LocalFsService from conftest.py (via local_fs_cls),
 which operates on the local file system.
 """
 
 from __future__ import annotations
 
-from pathlib import Path
+import os
 
 import pytest
 from fastapi import HTTPException
 
-from aiso_core.services.container_fs_service import ContainerFsService, _validate_path
+from aiso_core.services.container_fs_service import (
+    ContainerFsService,
+    PathTraversalError,
+    _validate_path,
+)
+from aiso_core.services.container_service import _DEFAULT_SUBDIRS
 
-# ── _validate_path tests ──
+_TOUCH_FLAGS = os.O_CREAT | os.O_WRONLY
 
 
-class TestValidatePath:
-    def test_normal_path(self) -> None:
-        _validate_path("/Documents/test.txt")
+def _touch(path: str) -> None:
+    os.close(os.open(path, _TOUCH_FLAGS, 0o644))
 
-    def test_root_path(self) -> None:
-        _validate_path("/")
 
-    def test_nested_path(self) -> None:
-        _validate_path("/Desktop/folder/subfolder/file.txt")
+def _touch_many(directory: str, names: list[str]) -> None:
+    for name in names:
+        _touch(os.path.join(directory, name))
 
-    def test_dotdot_raises(self) -> None:
-        with pytest.raises(HTTPException) as exc_info:
-            _validate_path("/Documents/../etc/passwd")
-        assert exc_info.value.status_code == 400
 
-    def test_dotdot_at_start_raises(self) -> None:
-        with pytest.raises(HTTPException):
-            _validate_path("/../secret")
+def _write(path: str, data: bytes) -> None:
+    with open(path, "wb") as f:
+        f.write(data)
+
 
-    def test_single_dot_allowed(self) -> None:
-        _validate_path("/Documents/./file.txt")  # single dot "." is allowed
+def _read(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
 
-    def test_dotdot_in_name_allowed(self) -> None:
-        _validate_path("/Documents/my..file.txt")  # ".." in filename is allowed
+
+# ── _validate_path tests ──
+
+
+@pytest.mark.fast
+class TestValidatePath:
+    @pytest.mark.parametrize(
+        ("path", "raises"),
+        [
+            ("/Documents/test.txt", False),
+            ("/", False),
+            ("/Desktop/folder/subfolder/file.txt", False),
+            ("/Documents/./file.txt", False),  # single dot "." is allowed
+            ("/Documents/my..file.txt", False),  # ".." in filename is allowed
+            ("/Documents/../etc/passwd", True),
+            ("/../secret", True),
+        ],
+    )
+    def test_validate_path(self, path: str, raises: bool) -> None:
+        if raises:
+            with pytest.raises(PathTraversalError):
+                _validate_path(path)
+        else:
+            _validate_path(path)
 
 
 # ── Path conversion tests ──
 
 
+@pytest.fixture(scope="module")
+def svc() -> ContainerFsService:
+    return ContainerFsService("test_container", "/home/aisu")
+
+
+@pytest.mark.fast
 class TestPathConversion:
-    def test_vfs_to_container_root(self) -> None:
-        svc = ContainerFsService("test_container", "/home/aisu")
-        assert svc._vfs_to_container("/") == "/home/aisu"
-
-    def test_vfs_to_container_subpath(self) -> None:
-        svc = ContainerFsService("test_container", "/home/aisu")
-        assert svc._vfs_to_container("/Documents") == "/home/aisu/Documents"
-
-    def test_vfs_to_container_deep_path(self) -> None:
-        svc = ContainerFsService("test_container", "/home/aisu")
-        assert svc._vfs_to_container("/Desktop/a/b") == "/home/aisu/Desktop/a/b"
-
-    def test_container_to_vfs_root(self) -> None:
-        svc = ContainerFsService("test_container", "/home/aisu")
-        assert svc._container_to_vfs("/home/aisu") == "/"
-        assert svc._container_to_vfs("/home/aisu/") == "/"
-
-    def test_container_to_vfs_subpath(self) -> None:
-        svc = ContainerFsService("test_container", "/home/aisu")
-        assert svc._container_to_vfs("/home/aisu/Documents") == "/Documents"
-
-    def test_container_to_vfs_unknown_path(self) -> None:
-        svc = ContainerFsService("test_container", "/home/aisu")
-        assert svc._container_to_vfs("/etc/passwd") == "/etc/passwd"
-
-    def test_vfs_to_container_traversal_blocked(self) -> None:
-        svc = ContainerFsService("test_container", "/home/aisu")
-        with pytest.raises(HTTPException):
+    @pytest.mark.parametrize(
+        ("vfs_path", "expected"),
+        [
+            ("/", "/home/aisu"),
+            ("/Documents", "/home/aisu/Documents"),
+            ("/Desktop/a/b", "/home/aisu/Desktop/a/b"),
+        ],
+    )
+    def test_vfs_to_container(self, svc: ContainerFsService, vfs_path: str, expected: str) -> None:
+        assert svc._vfs_to_container(vfs_path) == expected
+
+    @pytest.mark.parametrize(
+        ("container_path", "expected"),
+        [
+            ("/home/aisu", "/"),
+            ("/home/aisu/", "/"),
+            ("/home/aisu/Documents", "/Documents"),
+            ("/etc/passwd", "/etc/passwd"),
+        ],
+    )
+    def test_container_to_vfs(
+        self, svc: ContainerFsService, container_path: str, expected: str
+    ) -> None:
+        assert svc._container_to_vfs(container_path) == expected
+
+    def test_vfs_to_container_traversal_blocked(self, svc: ContainerFsService) -> None:
+        with pytest.raises(PathTraversalError):
             svc._vfs_to_container("/Documents/../../../etc/passwd")
 
 
 # ── ContainerFsService operations (on local file system) ──
-# _LocalFsService from conftest.py is not used here —
-# path logic in ContainerFsService is tested directly.
-# Mocks are used for Docker-dependent methods.
 
 
+@pytest.mark.fs
+@pytest.mark.asyncio(loop_scope="session")
 class TestContainerFsOperations:
     """Test ContainerFsService operations on the local file system.
 
@@ -91,23 +118,64 @@ class TestContainerFsOperations:
     """
 
     @pytest.fixture
-    def fs_root(self, tmp_path) -> Path:
+    def fs_root(self, tmp_path) -> str:
         """File system root directory for tests."""
-        base = tmp_path / "home" / "aisu"
-        for d in ["Desktop", "Documents", "Downloads", "Pictures", "Music", "Videos", ".Trash"]:
-            (base / d).mkdir(parents=True)
+        base = os.path.join(tmp_path, "home", "aisu")
+        os.makedirs(base)
+        for d in _DEFAULT_SUBDIRS:
+            os.mkdir(os.path.join(base, d))
         return base
 
     @pytest.fixture
-    def local_fs(self, fs_root: Path):
+    def local_fs(self, local_fs_cls: type, fs_root: str):
         """Mock service that operates on the local file system."""
-        from tests.conftest import _LocalFsService
-
-        svc = _LocalFsService.__new__(_LocalFsService)
+        svc = local_fs_cls.__new__(local_fs_cls)
         svc.container_name = "test_container"
-        svc.base_path = str(fs_root)
+        svc.base_path = fs_root
+        svc._docs = os.path.join(fs_root, "Documents")
+        svc._desktop = os.path.join(fs_root, "Desktop")
+        svc._trash = os.path.join(fs_root, ".Trash")
         return svc
 
+    # ── combined scenario ──
+
+    async def test_full_lifecycle(self, local_fs) -> None:
+        """create → stat → list → rename → move → copy → delete → trash on one tree."""
+        work = os.path.join(local_fs._docs, "work")
+        await local_fs.create_directory("/Documents/work")
+        await local_fs.create_file("/Documents/work/a.txt")
+        await local_fs.create_file("/Documents/work/c.txt")
+        assert os.path.isdir(work)
+        _write(os.path.join(work, "a.txt"), b"hello")
+
+        stat = await local_fs.stat_path("/Documents/work/a.txt")
+        assert stat is not None
+        assert (stat["type"], stat["name"], stat["size"]) == ("file", "a.txt", 5)
+        listing = await local_fs.list_directory("/Documents/work")
+        assert [i["name"] for i in listing] == ["a.txt", "c.txt"]
+
+        await local_fs.rename("/Documents/work/a.txt", "/Documents/work/b.txt")
+        assert not os.path.exists(os.path.join(work, "a.txt"))
+        assert _read(os.path.join(work, "b.txt")) == b"hello"
+
+        assert await local_fs.move("/Documents/work/b.txt", "/Desktop") == "/Desktop/b.txt"
+        assert not os.path.exists(os.path.join(work, "b.txt"))
+
+        assert await local_fs.copy("/Desktop/b.txt", "/Documents") == "/Documents/b.txt"
+        assert _read(os.path.join(local_fs._docs, "b.txt")) == b"hello"
+        assert os.path.exists(os.path.join(local_fs._desktop, "b.txt"))
+
+        await local_fs.delete("/Documents/b.txt")
+        assert not os.path.exists(os.path.join(local_fs._docs, "b.txt"))
+
+        assert await local_fs.move_to_trash("/Desktop/b.txt") == "/.Trash/b.txt"
+        assert not os.path.exists(os.path.join(local_fs._desktop, "b.txt"))
+        assert _read(os.path.join(local_fs._trash, "b.txt")) == b"hello"
+        assert await local_fs.move_to_trash("/Documents/work") == "/.Trash/work"
+
+        assert await local_fs.empty_trash() == 2
+        assert await local_fs.list_directory("/.Trash") == []
+
     # ── exists ──
 
     async def test_exists_root(self, local_fs) -> None:
@@ -121,24 +189,27 @@ class TestContainerFsOperations:
 
     # ── create_file ──
 
-    async def test_create_file(self, local_fs, fs_root: Path) -> None:
+    @pytest.mark.granular
+    async def test_create_file(self, local_fs) -> None:
         await local_fs.create_file("/Documents/test.txt")
-        assert (fs_root / "Documents" / "test.txt").exists()
+        assert os.path.exists(os.path.join(local_fs._docs, "test.txt"))
 
     # ── create_directory ──
 
-    async def test_create_directory(self, local_fs, fs_root: Path) -> None:
+    @pytest.mark.granular
+    async def test_create_directory(self, local_fs) -> None:
         await local_fs.create_directory("/Documents/new_folder")
-        assert (fs_root / "Documents" / "new_folder").is_dir()
+        assert os.path.isdir(os.path.join(local_fs._docs, "new_folder"))
 
-    async def test_create_nested_directory(self, local_fs, fs_root: Path) -> None:
+    async def test_create_nested_directory(self, local_fs) -> None:
         await local_fs.create_directory("/Documents/a/b/c")
-        assert (fs_root / "Documents" / "a" / "b" / "c").is_dir()
+        assert os.path.isdir(os.path.join(local_fs._docs, "a", "b", "c"))
 
     # ── stat_path ──
 
-    async def test_stat_file(self, local_fs, fs_root: Path) -> None:
-        (fs_root / "Documents" / "hello.txt").write_text("hello world")
+    @pytest.mark.granular
+    async def test_stat_file(self, local_fs) -> None:
+        _write(os.path.join(local_fs._docs, "hello.txt"), b"hello world")
         result = await local_fs.stat_path("/Documents/hello.txt")
         assert result is not None
         assert result["type"] == "file"
@@ -161,9 +232,9 @@ class TestContainerFsOperations:
         assert isinstance(items, list)
         assert len(items) == 0
 
-    async def test_list_directory_with_files(self, local_fs, fs_root: Path) -> None:
-        (fs_root / "Documents" / "a.txt").touch()
-        (fs_root / "Documents" / "b.txt").touch()
+    @pytest.mark.granular
+    async def test_list_directory_with_files(self, local_fs) -> None:
+        _touch_many(local_fs._docs, ["a.txt", "b.txt"])
         items = await local_fs.list_directory("/Documents")
         names = [i["name"] for i in items]
         assert "a.txt" in names
@@ -174,92 +245,99 @@ class TestContainerFsOperations:
             await local_fs.list_directory("/nonexistent")
         assert exc_info.value.status_code == 404
 
-    async def test_list_directory_dirs_first(self, local_fs, fs_root: Path) -> None:
+    async def test_list_directory_dirs_first(self, local_fs) -> None:
         """Directories should come before files."""
-        (fs_root / "Desktop" / "subdir").mkdir()
-        (fs_root / "Desktop" / "file.txt").touch()
+        os.mkdir(os.path.join(local_fs._desktop, "subdir"))
+        _touch(os.path.join(local_fs._desktop, "file.txt"))
         items = await local_fs.list_directory("/Desktop")
         assert items[0]["type"] == "directory"
         assert items[1]["type"] == "file"
+        with os.scandir(local_fs._desktop) as it:
+            on_disk = {e.name: e.is_dir() for e in it}
+        assert on_disk == {i["name"]: i["type"] == "directory" for i in items}
 
     # ── rename ──
 
-    async def test_rename_file(self, local_fs, fs_root: Path) -> None:
-        (fs_root / "Documents" / "old.txt").write_text("content")
+    @pytest.mark.granular
+    async def test_rename_file(self, local_fs) -> None:
+        _write(os.path.join(local_fs._docs, "old.txt"), b"content")
         await local_fs.rename("/Documents/old.txt", "/Documents/new.txt")
-        assert not (fs_root / "Documents" / "old.txt").exists()
-        assert (fs_root / "Documents" / "new.txt").read_text() == "content"
+        assert not os.path.exists(os.path.join(local_fs._docs, "old.txt"))
+        assert _read(os.path.join(local_fs._docs, "new.txt")) == b"content"
 
     # ── move ──
 
-    async def test_move_file(self, local_fs, fs_root: Path) -> None:
-        (fs_root / "Documents" / "moveme.txt").write_text("data")
+    @pytest.mark.granular
+    async def test_move_file(self, local_fs) -> None:
+        _write(os.path.join(local_fs._docs, "moveme.txt"), b"data")
         new_path = await local_fs.move("/Documents/moveme.txt", "/Desktop")
         assert new_path == "/Desktop/moveme.txt"
-        assert not (fs_root / "Documents" / "moveme.txt").exists()
-        assert (fs_root / "Desktop" / "moveme.txt").read_text() == "data"
+        assert not os.path.exists(os.path.join(local_fs._docs, "moveme.txt"))
+        assert _read(os.path.join(local_fs._desktop, "moveme.txt")) == b"data"
 
-    async def test_move_to_root(self, local_fs, fs_root: Path) -> None:
-        (fs_root / "Documents" / "file.txt").touch()
+    async def test_move_to_root(self, local_fs) -> None:
+        _touch(os.path.join(local_fs._docs, "file.txt"))
         new_path = await local_fs.move("/Documents/file.txt", "/")
         assert new_path == "/file.txt"
 
     # ── copy ──
 
-    async def test_copy_file(self, local_fs, fs_root: Path) -> None:
-        (fs_root / "Documents" / "original.txt").write_text("original")
+    @pytest.mark.granular
+    async def test_copy_file(self, local_fs) -> None:
+        _write(os.path.join(local_fs._docs, "original.txt"), b"original")
         new_path = await local_fs.copy("/Documents/original.txt", "/Desktop")
         assert new_path == "/Desktop/original.txt"
-        assert (fs_root / "Documents" / "original.txt").exists()  # original still exists
-        assert (fs_root / "Desktop" / "original.txt").read_text() == "original"
+        assert os.path.exists(os.path.join(local_fs._docs, "original.txt"))  # original still exists
+        assert _read(os.path.join(local_fs._desktop, "original.txt")) == b"original"
 
-    async def test_copy_directory(self, local_fs, fs_root: Path) -> None:
-        src = fs_root / "Documents" / "mydir"
-        src.mkdir()
-        (src / "file.txt").write_text("inside")
+    async def test_copy_directory(self, local_fs) -> None:
+        os.mkdir(os.path.join(local_fs._docs, "mydir"))
+        _write(os.path.join(local_fs._docs, "mydir", "file.txt"), b"inside")
         new_path = await local_fs.copy("/Documents/mydir", "/Desktop")
         assert new_path == "/Desktop/mydir"
-        assert (fs_root / "Desktop" / "mydir" / "file.txt").read_text() == "inside"
+        assert _read(os.path.join(local_fs._desktop, "mydir", "file.txt")) == b"inside"
 
     # ── delete ──
 
-    async def test_delete_file(self, local_fs, fs_root: Path) -> None:
-        (fs_root / "Documents" / "delete_me.txt").touch()
+    @pytest.mark.granular
+    async def test_delete_file(self, local_fs) -> None:
+        _touch(os.path.join(local_fs._docs, "delete_me.txt"))
         await local_fs.delete("/Documents/delete_me.txt")
-        assert not (fs_root / "Documents" / "delete_me.txt").exists()
+        assert not os.path.exists(os.path.join(local_fs._docs, "delete_me.txt"))
 
-    async def test_delete_directory(self, local_fs, fs_root: Path) -> None:
-        d = fs_root / "Documents" / "del_dir"
-        d.mkdir()
-        (d / "inner.txt").touch()
+    async def test_delete_directory(self, local_fs) -> None:
+        d = os.path.join(local_fs._docs, "del_dir")
+        os.mkdir(d)
+        _touch(os.path.join(d, "inner.txt"))
         await local_fs.delete("/Documents/del_dir")
-        assert not d.exists()
+        assert not os.path.exists(d)
 
     # ── move_to_trash ──
 
-    async def test_move_to_trash(self, local_fs, fs_root: Path) -> None:
-        (fs_root / "Documents" / "trash_me.txt").write_text("trash")
+    @pytest.mark.granular
+    async def test_move_to_trash(self, local_fs) -> None:
+        _write(os.path.join(local_fs._docs, "trash_me.txt"), b"trash")
         trash_path = await local_fs.move_to_trash("/Documents/trash_me.txt")
         assert trash_path == "/.Trash/trash_me.txt"
-        assert not (fs_root / "Documents" / "trash_me.txt").exists()
-        assert (fs_root / ".Trash" / "trash_me.txt").read_text() == "trash"
+        assert not os.path.exists(os.path.join(local_fs._docs, "trash_me.txt"))
+        assert _read(os.path.join(local_fs._trash, "trash_me.txt")) == b"trash"
 
-    async def test_move_to_trash_duplicate_name(self, local_fs, fs_root: Path) -> None:
+    async def test_move_to_trash_duplicate_name(self, local_fs) -> None:
         """If a file with the same name exists in Trash, a unique name is generated."""
-        (fs_root / ".Trash" / "dup.txt").touch()
-        (fs_root / "Documents" / "dup.txt").touch()
+        _touch(os.path.join(local_fs._trash, "dup.txt"))
+        _touch(os.path.join(local_fs._docs, "dup.txt"))
         trash_path = await local_fs.move_to_trash("/Documents/dup.txt")
         assert trash_path == "/.Trash/dup.txt 2"
 
     # ── empty_trash ──
 
-    async def test_empty_trash(self, local_fs, fs_root: Path) -> None:
-        (fs_root / ".Trash" / "file1.txt").touch()
-        (fs_root / ".Trash" / "file2.txt").touch()
+    @pytest.mark.granular
+    async def test_empty_trash(self, local_fs) -> None:
+        _touch_many(local_fs._trash, ["file1.txt", "file2.txt"])
         count = await local_fs.empty_trash()
         assert count == 2
-        items = await local_fs.list_directory("/.Trash")
-        assert len(items) == 0
+        with os.scandir(local_fs._trash) as it:
+            assert [e.name for e in it] == []
 
     async def test_empty_trash_when_empty(self, local_fs) -> None:
         count = await local_fs.empty_trash()
@@ -267,14 +345,14 @@ class TestContainerFsOperations:
 
     # ── search ──
 
-    async def test_search_finds_file(self, local_fs, fs_root: Path) -> None:
-        (fs_root / "Documents" / "report.pdf").touch()
+    async def test_search_finds_file(self, local_fs) -> None:
+        _touch(os.path.join(local_fs._docs, "report.pdf"))
         results = await local_fs.search("report")
         names = [r["name"] for r in results]
         assert "report.pdf" in names
 
-    async def test_search_case_insensitive(self, local_fs, fs_root: Path) -> None:
-        (fs_root / "Documents" / "MyFile.TXT").touch()
+    async def test_search_case_insensitive(self, local_fs) -> None:
+        _touch(os.path.join(local_fs._docs, "MyFile.TXT"))
         results = await local_fs.search("myfile")
         assert len(results) >= 1
         assert results[0]["name"] == "MyFile.TXT"
@@ -283,53 +361,42 @@ class TestContainerFsOperations:
         results = await local_fs.search("nonexistent_file_xyz")
         assert len(results) == 0
 
-    async def test_search_with_scope(self, local_fs, fs_root: Path) -> None:
-        (fs_root / "Documents" / "scoped.txt").touch()
-        (fs_root / "Desktop" / "scoped.txt").touch()
+    async def test_search_with_scope(self, local_fs) -> None:
+        _touch(os.path.join(local_fs._docs, "scoped.txt"))
+        _touch(os.path.join(local_fs._desktop, "scoped.txt"))
         results = await local_fs.search("scoped", scope_vfs="/Documents")
         assert len(results) == 1
         assert results[0]["name"] == "scoped.txt"
 
     # ── get_tree ──
 
-    async def test_get_tree_returns_root(self, local_fs) -> None:
+    async def test_get_tree(self, local_fs) -> None:
+        _touch(os.path.join(local_fs._desktop, "note.txt"))
         tree = await local_fs.get_tree()
         assert tree["type"] == "directory"
         assert tree["name"] == "/"
-        assert "children" in tree
-
-    async def test_get_tree_includes_subdirs(self, local_fs) -> None:
-        tree = await local_fs.get_tree()
-        child_names = [c["name"] for c in tree["children"]]
-        assert "Desktop" in child_names
-        assert "Documents" in child_names
-
-    async def test_get_tree_includes_files(self, local_fs, fs_root: Path) -> None:
-        (fs_root / "Desktop" / "note.txt").touch()
-        tree = await local_fs.get_tree()
+        child_names = {c["name"] for c in tree["children"]}
+        assert {"Desktop", "Documents"} <= child_names
         desktop = next(c for c in tree["children"] if c["name"] == "Desktop")
-        file_names = [c["name"] for c in desktop["children"]]
-        assert "note.txt" in file_names
+        assert "note.txt" in {c["name"] for c in desktop["children"]}
 
     # ── generate_unique_name ──
 
-    async def test_generate_unique_name_no_conflict(self, local_fs) -> None:
-        name = await local_fs.generate_unique_name("/Documents", "new_file.txt")
-        assert name == "new_file.txt"
-
-    async def test_generate_unique_name_with_conflict(self, local_fs, fs_root: Path) -> None:
-        (fs_root / "Documents" / "file.txt").touch()
-        name = await local_fs.generate_unique_name("/Documents", "file.txt")
-        assert name == "file.txt 2"
-
-    async def test_generate_unique_name_multiple_conflicts(self, local_fs, fs_root: Path) -> None:
-        (fs_root / "Documents" / "file.txt").touch()
-        (fs_root / "Documents" / "file.txt 2").touch()
-        (fs_root / "Documents" / "file.txt 3").touch()
-        name = await local_fs.generate_unique_name("/Documents", "file.txt")
-        assert name == "file.txt 4"
-
-    async def test_generate_unique_name_root(self, local_fs, fs_root: Path) -> None:
-        (fs_root / "test.txt").touch()
+    @pytest.mark.parametrize(
+        ("preexist", "base_name", "expected"),
+        [
+            ([], "new_file.txt", "new_file.txt"),
+            (["file.txt"], "file.txt", "file.txt 2"),
+            (["file.txt", "file.txt 2", "file.txt 3"], "file.txt", "file.txt 4"),
+        ],
+    )
+    async def test_generate_unique_name(
+        self, local_fs, preexist: list[str], base_name: str, expected: str
+    ) -> None:
+        _touch_many(local_fs._docs, preexist)
+        assert await local_fs.generate_unique_name("/Documents", base_name) == expected
+
+    async def test_generate_unique_name_root(self, local_fs, fs_root: str) -> None:
+        _touch(os.path.join(fs_root, "test.txt"))
         name = await local_fs.generate_unique_name("/", "test.txt")
         assert name == "test.txt 2"
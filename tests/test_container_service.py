@@ -5,16 +5,21 @@ Works with mocks in a non-real Docker environment.
 
 from __future__ import annotations
 
+import itertools
+import os
 import uuid
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
 
 import pytest
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from aiso_core.config import settings
 from aiso_core.models.user import User
 from aiso_core.models.user_container import UserContainer
+from aiso_core.services import container_service as _cs
 from aiso_core.services.container_service import (
+    _DEFAULT_SUBDIRS,
     ContainerService,
     _create_container_sync,
     _create_user_dirs,
@@ -22,143 +27,180 @@ from aiso_core.services.container_service import (
     _parse_mem_str,
 )
 
-# ── Helper function tests ──
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
 
+_uuid_counter = itertools.count(1)
 
-class TestParseMemStr:
-    def test_gigabytes(self) -> None:
-        assert _parse_mem_str("1g") == 1024**3
 
-    def test_megabytes(self) -> None:
-        assert _parse_mem_str("512m") == 512 * 1024**2
+def _fresh_uuid() -> uuid.UUID:
+    """Unique within the process (and so per xdist worker) — no urandom read."""
+    return uuid.UUID(int=next(_uuid_counter))
+
+
+_RAM = 2 * 1024**3
+_DISK = 5120 * 1024 * 1024
+
+# Never monkeypatched in this module (unlike user_data_base_path), so safe to read once.
+_NETWORK = settings.container_network
+
+# Docker inspect payloads shared by reference — nothing under test mutates them.
+_ATTRS_WITH_IP = {"NetworkSettings": {"Networks": {_NETWORK: {"IPAddress": "172.18.0.5"}}}}
+_ATTRS_EMPTY: dict = {"NetworkSettings": {"Networks": {}}}
+
+
+def _container_name(user: User) -> str:
+    return f"aisu_{user.id}"
+
+
+def _ok_result(user: User, container_id: str = "docker_abc", ip: str = "172.18.0.5") -> dict:
+    """_create_container_sync result for a successful create."""
+    return {
+        "container_id": container_id,
+        "container_name": _container_name(user),
+        "container_ip": ip,
+        "status": "running",
+    }
+
+
+_ERR_RESULT_TEMPLATE = {"container_id": None, "container_ip": None, "status": "error"}
+
+
+def _err_result(user: User) -> dict:
+    """_create_container_sync result when Docker refused the create."""
+    return {**_ERR_RESULT_TEMPLATE, "container_name": _container_name(user)}
+
 
-    def test_kilobytes(self) -> None:
-        assert _parse_mem_str("100k") == 100 * 1024
+def _make_container(
+    user: User, *, container_id: str | None = "docker_123", status: str = "running"
+) -> UserContainer:
+    return UserContainer(
+        user_id=user.id,
+        container_name=_container_name(user),
+        container_id=container_id,
+        status=status,
+        cpu_limit=2,
+        ram_limit=_RAM,
+        disk_limit=_DISK,
+        network_rate="5mbit",
+    )
 
-    def test_terabytes(self) -> None:
-        assert _parse_mem_str("1t") == 1024**4
 
-    def test_plain_bytes(self) -> None:
-        assert _parse_mem_str("1024") == 1024
+@pytest.fixture
+def patched_docker(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Docker client handed out by container_service._get_docker_client."""
+    client = MagicMock()
+    monkeypatch.setattr(_cs, "_get_docker_client", lambda: client)
+    return client
 
-    def test_uppercase(self) -> None:
-        assert _parse_mem_str("2G") == 2 * 1024**3
 
-    def test_with_spaces(self) -> None:
-        assert _parse_mem_str("  4m  ") == 4 * 1024**2
+@pytest.fixture
+def patched_create_sync(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Stand-in for _create_container_sync; tests set ``return_value``."""
+    create_sync = MagicMock()
+    monkeypatch.setattr(_cs, "_create_container_sync", create_sync)
+    return create_sync
 
 
+@pytest.fixture(scope="session")
+def data_base(tmp_path_factory) -> str:
+    """Shared user-data root; _create_user_dirs uses exist_ok, so reuse is safe."""
+    return str(tmp_path_factory.mktemp("userdata"))
+
+
+@pytest.fixture
+def patched_user_data_path(monkeypatch: pytest.MonkeyPatch, data_base: str) -> str:
+    """Point settings.user_data_base_path at the shared data_base."""
+    monkeypatch.setattr(settings, "user_data_base_path", data_base)
+    return data_base
+
+
+async def _seed(db: AsyncSession, *rows: object) -> None:
+    """Stage setup rows together and write them in a single flush."""
+    db.add_all(rows)
+    await db.flush()
+
+
+# ── Helper function tests ──
+
+
+@pytest.mark.fast
+class TestParseMemStr:
+    @pytest.mark.parametrize(
+        ("mem_str", "expected"),
+        [
+            ("1g", 1024**3),
+            ("512m", 512 * 1024**2),
+            ("100k", 100 * 1024),
+            ("1t", 1024**4),
+            ("1024", 1024),  # plain bytes
+            ("2G", 2 * 1024**3),  # uppercase
+            ("  4m  ", 4 * 1024**2),  # surrounding spaces
+        ],
+    )
+    def test_parse_mem_str(self, mem_str: str, expected: int) -> None:
+        assert _parse_mem_str(mem_str) == expected
+
+
+@pytest.mark.fast
 class TestGetUserDataPath:
-    def test_returns_absolute_path(self) -> None:
-        uid = uuid.uuid4()
+    def test_absolute_path_contains_user_id(self) -> None:
+        uid = _fresh_uuid()
         path = _get_user_data_path(uid)
         assert str(uid) in path
         assert path.startswith("/")
 
-    def test_path_contains_user_id(self) -> None:
-        uid = uuid.uuid4()
-        path = _get_user_data_path(uid)
-        assert str(uid) in path
-
 
 class TestCreateUserDirs:
-    def test_creates_all_subdirs(self, tmp_path) -> None:
-        uid = uuid.uuid4()
-        with patch.object(settings, "user_data_base_path", str(tmp_path)):
-            base = _create_user_dirs(uid)
-
-        expected_dirs = [
-            "Desktop",
-            "Documents",
-            "Downloads",
-            "Pictures",
-            "Music",
-            "Videos",
-            ".Trash",
-        ]
-        for d in expected_dirs:
-            assert (tmp_path / str(uid) / d).is_dir()
+    def test_creates_all_subdirs(self, patched_user_data_path: str) -> None:
+        uid = _fresh_uuid()
+        base = _create_user_dirs(uid)
+
+        for d in _DEFAULT_SUBDIRS:
+            assert os.path.isdir(os.path.join(patched_user_data_path, str(uid), d))
         assert str(uid) in base
 
-    def test_idempotent(self, tmp_path) -> None:
-        uid = uuid.uuid4()
-        with patch.object(settings, "user_data_base_path", str(tmp_path)):
-            _create_user_dirs(uid)
-            _create_user_dirs(uid)  # second call does not raise an error
+    def test_idempotent(self, patched_user_data_path: str) -> None:
+        uid = _fresh_uuid()
+        _create_user_dirs(uid)
+        _create_user_dirs(uid)  # second call does not raise an error
 
 
 class TestCreateContainerSync:
-    def test_success_returns_running(self) -> None:
-        mock_container = MagicMock()
+    def test_success_returns_running(self, patched_docker: MagicMock) -> None:
+        mock_container = MagicMock(spec=["id", "attrs", "reload"])
         mock_container.id = "abc123"
-        mock_container.attrs = {
-            "NetworkSettings": {
-                "Networks": {settings.container_network: {"IPAddress": "172.18.0.5"}}
-            }
-        }
-
-        mock_client = MagicMock()
-        mock_client.containers.run.return_value = mock_container
-
-        uid = uuid.uuid4()
-        with (
-            patch(
-                "aiso_core.services.container_service._get_docker_client",
-                return_value=mock_client,
-            ),
-            patch(
-                "aiso_core.services.container_service._get_user_data_path",
-                return_value="/data/users/" + str(uid),
-            ),
-        ):
-            result = _create_container_sync(uid, cpu=2, disk_mb=5120, ram_bytes=2 * 1024**3)
+        mock_container.attrs = _ATTRS_WITH_IP
+
+        patched_docker.containers.run.return_value = mock_container
+
+        uid = _fresh_uuid()
+        result = _create_container_sync(uid, cpu=2, disk_mb=5120, ram_bytes=_RAM)
 
         assert result["status"] == "running"
         assert result["container_id"] == "abc123"
         assert result["container_ip"] == "172.18.0.5"
         assert result["container_name"] == f"aisu_{uid}"
 
-    def test_docker_error_returns_error(self) -> None:
-        mock_client = MagicMock()
-        mock_client.containers.run.side_effect = RuntimeError("Docker daemon not found")
-
-        uid = uuid.uuid4()
-        with (
-            patch(
-                "aiso_core.services.container_service._get_docker_client",
-                return_value=mock_client,
-            ),
-            patch(
-                "aiso_core.services.container_service._get_user_data_path",
-                return_value="/data/users/" + str(uid),
-            ),
-        ):
-            result = _create_container_sync(uid, cpu=2, disk_mb=5120, ram_bytes=2 * 1024**3)
+    def test_docker_error_returns_error(self, patched_docker: MagicMock) -> None:
+        patched_docker.containers.run.side_effect = RuntimeError("Docker daemon not found")
+
+        uid = _fresh_uuid()
+        result = _create_container_sync(uid, cpu=2, disk_mb=5120, ram_bytes=_RAM)
 
         assert result["status"] == "error"
         assert result["container_id"] is None
         assert result["container_ip"] is None
 
-    def test_no_network_ip(self) -> None:
-        mock_container = MagicMock()
+    def test_no_network_ip(self, patched_docker: MagicMock) -> None:
+        mock_container = MagicMock(spec=["id", "attrs", "reload"])
         mock_container.id = "abc123"
-        mock_container.attrs = {"NetworkSettings": {"Networks": {}}}
-
-        mock_client = MagicMock()
-        mock_client.containers.run.return_value = mock_container
-
-        uid = uuid.uuid4()
-        with (
-            patch(
-                "aiso_core.services.container_service._get_docker_client",
-                return_value=mock_client,
-            ),
-            patch(
-                "aiso_core.services.container_service._get_user_data_path",
-                return_value="/data/users/" + str(uid),
-            ),
-        ):
-            result = _create_container_sync(uid, cpu=2, disk_mb=5120, ram_bytes=2 * 1024**3)
+        mock_container.attrs = _ATTRS_EMPTY
+
+        patched_docker.containers.run.return_value = mock_container
+
+        uid = _fresh_uuid()
+        result = _create_container_sync(uid, cpu=2, disk_mb=5120, ram_bytes=_RAM)
 
         assert result["status"] == "running"
         assert result["container_ip"] is None
@@ -167,23 +209,33 @@ class TestCreateContainerSync:
 # ── ContainerService tests ──
 
 
+@pytest.fixture(scope="module")
+def _user_fields() -> dict[str, object]:
+    """Column values for the test user, built once per module.
+
+    Each test's writes are rolled back (see conftest.db_connection), so the row
+    is still inserted by ``user`` — only the values are shared.
+    """
+    return {
+        "id": _fresh_uuid(),
+        "email": "container_test@test.com",
+        "username": "container_test",
+        "display_name": "Container Test",
+        "hashed_password": "$2b$12$dummy_hash_for_test",
+        "role": "user",
+        "is_active": True,
+        "cpu": 2,
+        "disk": 5120,
+    }
+
+
 class TestContainerService:
     @pytest.fixture
-    async def user(self, db_session: AsyncSession) -> User:
-        user = User(
-            id=uuid.uuid4(),
-            email="container_test@test.com",
-            username="container_test",
-            display_name="Container Test",
-            hashed_password="$2b$12$dummy_hash_for_test",
-            role="user",
-            is_active=True,
-            cpu=2,
-            disk=5120,
-        )
+    def user(self, db_session: AsyncSession, _user_fields: dict[str, object]) -> User:
+        # Left pending: it goes out in the same flush as any rows from _seed(),
+        # or via autoflush on the service's first query.
+        user = User(**_user_fields)
         db_session.add(user)
-        await db_session.commit()
-        await db_session.refresh(user)
         return user
 
     async def test_get_container_returns_none_when_not_exists(
@@ -199,25 +251,13 @@ class TestContainerService:
         self,
         db_session: AsyncSession,
         user: User,
-        tmp_path,
+        patched_create_sync: MagicMock,
+        patched_user_data_path: str,
     ) -> None:
-        mock_result = {
-            "container_id": "docker_abc",
-            "container_name": f"aisu_{user.id}",
-            "container_ip": "172.18.0.5",
-            "status": "running",
-        }
-
-        with (
-            patch.object(settings, "user_data_base_path", str(tmp_path)),
-            patch(
-                "aiso_core.services.container_service._create_container_sync",
-                return_value=mock_result,
-            ),
-        ):
-            service = ContainerService(db_session)
-            record = await service.provision_container(user.id, cpu=2, disk_mb=5120)
-            await db_session.commit()
+        patched_create_sync.return_value = _ok_result(user)
+        service = ContainerService(db_session)
+        record = await service.provision_container(user.id, cpu=2, disk_mb=5120)
+        await db_session.commit()
 
         assert record.status == "running"
         assert record.container_id == "docker_abc"
@@ -229,25 +269,13 @@ class TestContainerService:
         self,
         db_session: AsyncSession,
         user: User,
-        tmp_path,
+        patched_create_sync: MagicMock,
+        patched_user_data_path: str,
     ) -> None:
-        mock_result = {
-            "container_id": None,
-            "container_name": f"aisu_{user.id}",
-            "container_ip": None,
-            "status": "error",
-        }
-
-        with (
-            patch.object(settings, "user_data_base_path", str(tmp_path)),
-            patch(
-                "aiso_core.services.container_service._create_container_sync",
-                return_value=mock_result,
-            ),
-        ):
-            service = ContainerService(db_session)
-            record = await service.provision_container(user.id, cpu=2, disk_mb=5120)
-            await db_session.commit()
+        patched_create_sync.return_value = _err_result(user)
+        service = ContainerService(db_session)
+        record = await service.provision_container(user.id, cpu=2, disk_mb=5120)
+        await db_session.commit()
 
         assert record.status == "error"
         assert record.container_id is None
@@ -258,18 +286,7 @@ class TestContainerService:
         db_session: AsyncSession,
         user: User,
     ) -> None:
-        container = UserContainer(
-            user_id=user.id,
-            container_name=f"aisu_{user.id}",
-            container_id="docker_123",
-            status="running",
-            cpu_limit=2,
-            ram_limit=2 * 1024**3,
-            disk_limit=5120 * 1024 * 1024,
-            network_rate="5mbit",
-        )
-        db_session.add(container)
-        await db_session.commit()
+        await _seed(db_session, _make_container(user))
 
         service = ContainerService(db_session)
         result = await service.get_container(user.id)
@@ -280,146 +297,79 @@ class TestContainerService:
         self,
         db_session: AsyncSession,
         user: User,
-        tmp_path,
+        patched_create_sync: MagicMock,
+        patched_user_data_path: str,
     ) -> None:
-        mock_result = {
-            "container_id": "docker_new",
-            "container_name": f"aisu_{user.id}",
-            "container_ip": "172.18.0.10",
-            "status": "running",
-        }
-
-        with (
-            patch.object(settings, "user_data_base_path", str(tmp_path)),
-            patch(
-                "aiso_core.services.container_service._create_container_sync",
-                return_value=mock_result,
-            ),
-        ):
-            service = ContainerService(db_session)
-            result = await service.start_container(user.id, cpu=2, disk_mb=5120)
-            await db_session.commit()
+        patched_create_sync.return_value = _ok_result(
+            user, container_id="docker_new", ip="172.18.0.10"
+        )
+        service = ContainerService(db_session)
+        result = await service.start_container(user.id, cpu=2, disk_mb=5120)
+        await db_session.commit()
 
         assert result["status"] == "running"
         assert result["message"] == "Container provisioned"
 
-    async def test_start_container_already_running(
+    @pytest.mark.parametrize(
+        ("db_status", "docker_status", "start_raises", "exp_status", "exp_message"),
+        [
+            ("running", "running", False, "running", "Container already running"),
+            ("stopped", "exited", False, "running", "Container started"),
+            # DB says stopped, Docker says running — DB should be synced.
+            ("stopped", "running", False, "running", "Container already running"),
+            # Container exists in Docker but fails to start.
+            ("stopped", "exited", True, "error", "Failed to start container"),
+        ],
+        ids=["already_running", "stopped_starts_it", "syncs_running_status", "start_fails"],
+    )
+    async def test_start_container_existing_record(
         self,
         db_session: AsyncSession,
         user: User,
+        patched_docker: MagicMock,
+        db_status: str,
+        docker_status: str,
+        start_raises: bool,
+        exp_status: str,
+        exp_message: str,
     ) -> None:
-        container = UserContainer(
-            user_id=user.id,
-            container_name=f"aisu_{user.id}",
-            container_id="docker_123",
-            status="running",
-            cpu_limit=2,
-            ram_limit=2 * 1024**3,
-            disk_limit=5120 * 1024 * 1024,
-            network_rate="5mbit",
-        )
-        db_session.add(container)
-        await db_session.commit()
-
-        mock_docker_container = MagicMock()
-        mock_docker_container.status = "running"
-        mock_client = MagicMock()
-        mock_client.containers.get.return_value = mock_docker_container
-
-        with patch(
-            "aiso_core.services.container_service._get_docker_client",
-            return_value=mock_client,
-        ):
-            service = ContainerService(db_session)
-            result = await service.start_container(user.id, cpu=2, disk_mb=5120)
+        await _seed(db_session, _make_container(user, status=db_status))
 
-        assert result["status"] == "running"
-        assert result["message"] == "Container already running"
+        mock_docker_container = MagicMock(spec=["status", "attrs", "start", "reload"])
+        mock_docker_container.status = docker_status
+        mock_docker_container.attrs = _ATTRS_WITH_IP
+        if start_raises:
+            mock_docker_container.start.side_effect = Exception("Start failed")
+        patched_docker.containers.get.return_value = mock_docker_container
 
-    async def test_start_container_stopped_starts_it(
-        self,
-        db_session: AsyncSession,
-        user: User,
-    ) -> None:
-        container = UserContainer(
-            user_id=user.id,
-            container_name=f"aisu_{user.id}",
-            container_id="docker_123",
-            status="stopped",
-            cpu_limit=2,
-            ram_limit=2 * 1024**3,
-            disk_limit=5120 * 1024 * 1024,
-            network_rate="5mbit",
-        )
-        db_session.add(container)
+        service = ContainerService(db_session)
+        result = await service.start_container(user.id, cpu=2, disk_mb=5120)
         await db_session.commit()
 
-        mock_docker_container = MagicMock()
-        mock_docker_container.status = "exited"
-        mock_docker_container.attrs = {
-            "NetworkSettings": {
-                "Networks": {settings.container_network: {"IPAddress": "172.18.0.6"}}
-            }
-        }
-        mock_client = MagicMock()
-        mock_client.containers.get.return_value = mock_docker_container
-
-        with patch(
-            "aiso_core.services.container_service._get_docker_client",
-            return_value=mock_client,
-        ):
-            service = ContainerService(db_session)
-            result = await service.start_container(user.id, cpu=2, disk_mb=5120)
-            await db_session.commit()
-
-        assert result["status"] == "running"
-        assert result["message"] == "Container started"
-        mock_docker_container.start.assert_called_once()
+        assert result["status"] == exp_status
+        assert result["message"] == exp_message
+        if docker_status == "exited":
+            mock_docker_container.start.assert_called_once()
 
     async def test_start_container_docker_not_found_reprovisions(
         self,
         db_session: AsyncSession,
         user: User,
-        tmp_path,
+        patched_create_sync: MagicMock,
+        patched_docker: MagicMock,
+        patched_user_data_path: str,
     ) -> None:
-        container = UserContainer(
-            user_id=user.id,
-            container_name=f"aisu_{user.id}",
-            container_id="docker_old",
-            status="running",
-            cpu_limit=2,
-            ram_limit=2 * 1024**3,
-            disk_limit=5120 * 1024 * 1024,
-            network_rate="5mbit",
+        await _seed(db_session, _make_container(user, container_id="docker_old"))
+
+        patched_docker.containers.get.side_effect = Exception("Not found")
+
+        patched_create_sync.return_value = _ok_result(
+            user, container_id="docker_new", ip="172.18.0.11"
         )
-        db_session.add(container)
+        service = ContainerService(db_session)
+        result = await service.start_container(user.id, cpu=2, disk_mb=5120)
         await db_session.commit()
 
-        mock_client = MagicMock()
-        mock_client.containers.get.side_effect = Exception("Not found")
-
-        mock_result = {
-            "container_id": "docker_new",
-            "container_name": f"aisu_{user.id}",
-            "container_ip": "172.18.0.11",
-            "status": "running",
-        }
-
-        with (
-            patch(
-                "aiso_core.services.container_service._get_docker_client",
-                return_value=mock_client,
-            ),
-            patch.object(settings, "user_data_base_path", str(tmp_path)),
-            patch(
-                "aiso_core.services.container_service._create_container_sync",
-                return_value=mock_result,
-            ),
-        ):
-            service = ContainerService(db_session)
-            result = await service.start_container(user.id, cpu=2, disk_mb=5120)
-            await db_session.commit()
-
         assert result["status"] == "running"
         assert result["message"] == "Container re-provisioned"
 
@@ -438,18 +388,7 @@ class TestContainerService:
         db_session: AsyncSession,
         user: User,
     ) -> None:
-        container = UserContainer(
-            user_id=user.id,
-            container_name=f"aisu_{user.id}",
-            container_id="docker_123",
-            status="stopped",
-            cpu_limit=2,
-            ram_limit=2 * 1024**3,
-            disk_limit=5120 * 1024 * 1024,
-            network_rate="5mbit",
-        )
-        db_session.add(container)
-        await db_session.commit()
+        await _seed(db_session, _make_container(user, status="stopped"))
 
         service = ContainerService(db_session)
         result = await service.stop_container(user.id)
@@ -460,64 +399,36 @@ class TestContainerService:
         self,
         db_session: AsyncSession,
         user: User,
+        patched_docker: MagicMock,
     ) -> None:
-        container = UserContainer(
-            user_id=user.id,
-            container_name=f"aisu_{user.id}",
-            container_id="docker_123",
-            status="running",
-            cpu_limit=2,
-            ram_limit=2 * 1024**3,
-            disk_limit=5120 * 1024 * 1024,
-            network_rate="5mbit",
-        )
-        db_session.add(container)
-        await db_session.commit()
+        await _seed(db_session, _make_container(user))
 
-        mock_docker_container = MagicMock()
-        mock_client = MagicMock()
-        mock_client.containers.get.return_value = mock_docker_container
+        stop_calls: list[dict[str, object]] = []
+        patched_docker.containers.get.return_value = SimpleNamespace(
+            stop=lambda **kw: stop_calls.append(kw)
+        )
 
-        with patch(
-            "aiso_core.services.container_service._get_docker_client",
-            return_value=mock_client,
-        ):
-            service = ContainerService(db_session)
-            result = await service.stop_container(user.id)
-            await db_session.commit()
+        service = ContainerService(db_session)
+        result = await service.stop_container(user.id)
+        await db_session.commit()
 
         assert result["status"] == "stopped"
         assert result["message"] == "Container stopped"
-        mock_docker_container.stop.assert_called_once_with(timeout=10)
+        assert stop_calls == [{"timeout": 10}]
 
     async def test_stop_container_docker_error(
         self,
         db_session: AsyncSession,
         user: User,
+        patched_docker: MagicMock,
     ) -> None:
-        container = UserContainer(
-            user_id=user.id,
-            container_name=f"aisu_{user.id}",
-            container_id="docker_123",
-            status="running",
-            cpu_limit=2,
-            ram_limit=2 * 1024**3,
-            disk_limit=5120 * 1024 * 1024,
-            network_rate="5mbit",
-        )
-        db_session.add(container)
-        await db_session.commit()
+        await _seed(db_session, _make_container(user))
 
-        mock_client = MagicMock()
-        mock_client.containers.get.side_effect = Exception("Docker error")
+        patched_docker.containers.get.side_effect = Exception("Docker error")
 
-        with patch(
-            "aiso_core.services.container_service._get_docker_client",
-            return_value=mock_client,
-        ):
-            service = ContainerService(db_session)
-            result = await service.stop_container(user.id)
-            await db_session.commit()
+        service = ContainerService(db_session)
+        result = await service.stop_container(user.id)
+        await db_session.commit()
 
         assert result["status"] == "error"
 
@@ -535,18 +446,7 @@ class TestContainerService:
         db_session: AsyncSession,
         user: User,
     ) -> None:
-        container = UserContainer(
-            user_id=user.id,
-            container_name=f"aisu_{user.id}",
-            container_id=None,
-            status="creating",
-            cpu_limit=2,
-            ram_limit=2 * 1024**3,
-            disk_limit=5120 * 1024 * 1024,
-            network_rate="5mbit",
-        )
-        db_session.add(container)
-        await db_session.commit()
+        await _seed(db_session, _make_container(user, container_id=None, status="creating"))
 
         service = ContainerService(db_session)
         result = await service.get_container_status_live(user.id)
@@ -558,31 +458,16 @@ class TestContainerService:
         self,
         db_session: AsyncSession,
         user: User,
+        patched_docker: MagicMock,
     ) -> None:
-        container = UserContainer(
-            user_id=user.id,
-            container_name=f"aisu_{user.id}",
-            container_id="docker_123",
-            status="running",
-            cpu_limit=2,
-            ram_limit=2 * 1024**3,
-            disk_limit=5120 * 1024 * 1024,
-            network_rate="5mbit",
-        )
-        db_session.add(container)
-        await db_session.commit()
+        await _seed(db_session, _make_container(user))
 
-        mock_docker_container = MagicMock()
-        mock_docker_container.status = "running"
-        mock_client = MagicMock()
-        mock_client.containers.get.return_value = mock_docker_container
+        patched_docker.containers.get.return_value = SimpleNamespace(
+            status="running", reload=lambda: None
+        )
 
-        with patch(
-            "aiso_core.services.container_service._get_docker_client",
-            return_value=mock_client,
-        ):
-            service = ContainerService(db_session)
-            result = await service.get_container_status_live(user.id)
+        service = ContainerService(db_session)
+        result = await service.get_container_status_live(user.id)
 
         assert result is not None
         assert result["status"] == "running"
@@ -592,29 +477,14 @@ class TestContainerService:
         self,
         db_session: AsyncSession,
         user: User,
+        patched_docker: MagicMock,
     ) -> None:
-        container = UserContainer(
-            user_id=user.id,
-            container_name=f"aisu_{user.id}",
-            container_id="docker_123",
-            status="running",
-            cpu_limit=2,
-            ram_limit=2 * 1024**3,
-            disk_limit=5120 * 1024 * 1024,
-            network_rate="5mbit",
-        )
-        db_session.add(container)
-        await db_session.commit()
+        await _seed(db_session, _make_container(user))
 
-        mock_client = MagicMock()
-        mock_client.containers.get.side_effect = Exception("Connection refused")
+        patched_docker.containers.get.side_effect = Exception("Connection refused")
 
-        with patch(
-            "aiso_core.services.container_service._get_docker_client",
-            return_value=mock_client,
-        ):
-            service = ContainerService(db_session)
-            result = await service.get_container_status_live(user.id)
+        service = ContainerService(db_session)
+        result = await service.get_container_status_live(user.id)
 
         assert result is not None
         assert result["docker_status"] == "unreachable"
@@ -623,103 +493,19 @@ class TestContainerService:
         self,
         db_session: AsyncSession,
         user: User,
+        patched_docker: MagicMock,
     ) -> None:
         """Updates the DB if the status has changed in Docker."""
-        container = UserContainer(
-            user_id=user.id,
-            container_name=f"aisu_{user.id}",
-            container_id="docker_123",
-            status="running",
-            cpu_limit=2,
-            ram_limit=2 * 1024**3,
-            disk_limit=5120 * 1024 * 1024,
-            network_rate="5mbit",
-        )
-        db_session.add(container)
-        await db_session.commit()
-
-        mock_docker_container = MagicMock()
-        mock_docker_container.status = "exited"  # Different status in Docker
-        mock_client = MagicMock()
-        mock_client.containers.get.return_value = mock_docker_container
-
-        with patch(
-            "aiso_core.services.container_service._get_docker_client",
-            return_value=mock_client,
-        ):
-            service = ContainerService(db_session)
-            result = await service.get_container_status_live(user.id)
-            await db_session.commit()
-
-        assert result["status"] == "exited"
-        assert result["docker_status"] == "exited"
+        await _seed(db_session, _make_container(user))
 
-    async def test_start_container_syncs_running_status(
-        self,
-        db_session: AsyncSession,
-        user: User,
-    ) -> None:
-        """DB says stopped, Docker says running — DB should be synced."""
-        container = UserContainer(
-            user_id=user.id,
-            container_name=f"aisu_{user.id}",
-            container_id="docker_123",
-            status="stopped",
-            cpu_limit=2,
-            ram_limit=2 * 1024**3,
-            disk_limit=5120 * 1024 * 1024,
-            network_rate="5mbit",
+        # Different status in Docker
+        patched_docker.containers.get.return_value = SimpleNamespace(
+            status="exited", reload=lambda: None
         )
-        db_session.add(container)
-        await db_session.commit()
-
-        mock_docker_container = MagicMock()
-        mock_docker_container.status = "running"
-        mock_client = MagicMock()
-        mock_client.containers.get.return_value = mock_docker_container
-
-        with patch(
-            "aiso_core.services.container_service._get_docker_client",
-            return_value=mock_client,
-        ):
-            service = ContainerService(db_session)
-            result = await service.start_container(user.id, cpu=2, disk_mb=5120)
-            await db_session.commit()
 
-        assert result["status"] == "running"
-        assert result["message"] == "Container already running"
-
-    async def test_start_container_start_fails(
-        self,
-        db_session: AsyncSession,
-        user: User,
-    ) -> None:
-        """Container exists in Docker but fails to start."""
-        container = UserContainer(
-            user_id=user.id,
-            container_name=f"aisu_{user.id}",
-            container_id="docker_123",
-            status="stopped",
-            cpu_limit=2,
-            ram_limit=2 * 1024**3,
-            disk_limit=5120 * 1024 * 1024,
-            network_rate="5mbit",
-        )
-        db_session.add(container)
+        service = ContainerService(db_session)
+        result = await service.get_container_status_live(user.id)
         await db_session.commit()
 
-        mock_docker_container = MagicMock()
-        mock_docker_container.status = "exited"
-        mock_docker_container.start.side_effect = Exception("Start failed")
-        mock_client = MagicMock()
-        mock_client.containers.get.return_value = mock_docker_container
-
-        with patch(
-            "aiso_core.services.container_service._get_docker_client",
-            return_value=mock_client,
-        ):
-            service = ContainerService(db_session)
-            result = await service.start_container(user.id, cpu=2, disk_mb=5120)
-
-        assert result["status"] == "error"
-        assert result["message"] == "Failed to start container"
+        assert result["status"] == "exited"
+        assert result["docker_status"] == "exited"
@@ -1,80 +1,94 @@
+import uuid
+from collections.abc import AsyncGenerator
+
+import pytest
+import pytest_asyncio
 from httpx import AsyncClient
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from aiso_core.models.user import User
+from aiso_core.schemas.file_system import CreateNodeRequest
+from aiso_core.services.container_service import _DEFAULT_SUBDIRS
+from aiso_core.services.file_system_service import FileSystemService
+from aiso_core.utils.security import create_access_token
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def fs_user_id(db_engine: AsyncEngine) -> AsyncGenerator[uuid.UUID, None]:
+    """One user committed once per module.
+
+    The row is written outside the per-test transaction, so it survives each
+    test's rollback; everything the tests themselves write is still discarded.
+    """
+    user_id = uuid.uuid4()
+    async with AsyncSession(db_engine) as session:
+        session.add(
+            User(
+                id=user_id,
+                email="fs@example.com",
+                username="fsuser",
+                display_name="fsuser",
+                hashed_password="$2b$12$dummy_hash_for_test",
+            )
+        )
+        await session.commit()
 
+    yield user_id
 
-async def _register_and_login(
-    client: AsyncClient,
-    email: str,
-    username: str,
-    beta_token_store: dict[str, str],
-) -> str:
-    beta_request = await client.post(
-        "/api/v1/beta/access-request",
-        data={"email": email, "extra_text": "fs test invite"},
-    )
-    assert beta_request.status_code == 201
-    beta_token = beta_token_store[email]
-
-    register = await client.post(
-        "/api/v1/auth/register",
-        data={
-            "email": email,
-            "username": username,
-            "display_name": username,
-            "password": "secret123",
-            "beta_token": beta_token,
-        },
-    )
-    assert register.status_code == 201
+    async with AsyncSession(db_engine) as session:
+        await session.execute(delete(User).where(User.id == user_id))
+        await session.commit()
 
-    login = await client.post(
-        "/api/v1/auth/login",
-        json={"username": username, "password": "secret123"},
-    )
-    assert login.status_code == 200
-    return login.json()["access_token"]
 
+@pytest.fixture(scope="module")
+def fs_token(fs_user_id: uuid.UUID) -> str:
+    return create_access_token({"sub": str(fs_user_id)})
+
+
+@pytest.fixture
+def fs_client(client: AsyncClient, fs_token: str) -> AsyncClient:
+    client.headers["Authorization"] = f"Bearer {fs_token}"
+    return client
+
+
+class _FsSetup:
+    """Seeds nodes through FileSystemService directly — setup skips the HTTP stack."""
+
+    def __init__(self, service: FileSystemService, user_id: uuid.UUID) -> None:
+        self._service = service
+        self._user_id = user_id
+
+    async def create_file(self, parent_path: str, name: str, size: int = 0) -> None:
+        await self._service.create_node(
+            self._user_id,
+            CreateNodeRequest(parent_path=parent_path, name=name, node_type="file", size=size),
+        )
 
-def _auth_headers(token: str) -> dict[str, str]:
-    return {"Authorization": f"Bearer {token}"}
 
+@pytest.fixture
+def fs_setup(fs_client: AsyncClient, db_session: AsyncSession, fs_user_id: uuid.UUID) -> _FsSetup:
+    # Depends on fs_client so the local-fs ContainerFsService stand-in is installed.
+    return _FsSetup(FileSystemService(db_session, f"aisu_{fs_user_id}"), fs_user_id)
 
-async def test_fs_tree_seeds_default_dirs(client: AsyncClient, beta_token_store: dict[str, str]):
-    token = await _register_and_login(client, "fs1@example.com", "fsuser1", beta_token_store)
 
-    tree = await client.get("/api/v1/fs/tree", headers=_auth_headers(token))
-    assert tree.status_code == 200
-    data = tree.json()
+@pytest.mark.parametrize(
+    ("url", "params"),
+    [("/api/v1/fs/tree", None), ("/api/v1/fs/ls", {"path": "/"})],
+    ids=["tree", "ls"],
+)
+async def test_fs_root_seeds_default_dirs(
+    fs_client: AsyncClient, url: str, params: dict[str, str] | None
+) -> None:
+    response = await fs_client.get(url, params=params)
+    assert response.status_code == 200
+    data = response.json()
     assert data["path"] == "/"
+    assert {child["name"] for child in data["children"]} == set(_DEFAULT_SUBDIRS)
 
-    child_names = {child["name"] for child in data["children"]}
-    expected = {
-        "Desktop",
-        "Documents",
-        "Downloads",
-        "Pictures",
-        "Music",
-        "Videos",
-        ".Trash",
-    }
-    assert child_names == expected
-
-
-async def test_fs_list_directory_and_get_node(
-    client: AsyncClient, beta_token_store: dict[str, str]
-):
-    token = await _register_and_login(client, "fs2@example.com", "fsuser2", beta_token_store)
-
-    root = await client.get(
-        "/api/v1/fs/ls",
-        params={"path": "/"},
-        headers=_auth_headers(token),
-    )
-    assert root.status_code == 200
-    root_data = root.json()
-    assert root_data["path"] == "/"
-    assert root_data["total"] == 7
 
-    created = await client.post(
+async def test_fs_create_and_get_node(fs_client: AsyncClient) -> None:
+    created = await fs_client.post(
         "/api/v1/fs/node",
         json={
             "parent_path": "/Documents",
@@ -82,100 +96,69 @@ async def test_fs_list_directory_and_get_node(
             "node_type": "file",
             "size": 12,
         },
-        headers=_auth_headers(token),
     )
     assert created.status_code == 201
     created_data = created.json()
     assert created_data["path"] == "/Documents/note.txt"
     assert created_data["node_type"] == "file"
 
-    fetched = await client.get(
-        "/api/v1/fs/node",
-        params={"path": "/Documents/note.txt"},
-        headers=_auth_headers(token),
-    )
+    fetched = await fs_client.get("/api/v1/fs/node", params={"path": "/Documents/note.txt"})
     assert fetched.status_code == 200
     assert fetched.json()["path"] == "/Documents/note.txt"
 
 
-async def test_fs_rename_and_move(client: AsyncClient, beta_token_store: dict[str, str]):
-    token = await _register_and_login(client, "fs3@example.com", "fsuser3", beta_token_store)
+async def test_fs_rename_and_move(fs_client: AsyncClient, fs_setup: _FsSetup) -> None:
+    await fs_setup.create_file("/Documents", "note.txt", size=5)
 
-    await client.post(
-        "/api/v1/fs/node",
-        json={
-            "parent_path": "/Documents",
-            "name": "note.txt",
-            "node_type": "file",
-            "size": 5,
-        },
-        headers=_auth_headers(token),
-    )
-
-    renamed = await client.patch(
+    renamed = await fs_client.patch(
         "/api/v1/fs/rename",
         json={"path": "/Documents/note.txt", "new_name": "note2.txt"},
-        headers=_auth_headers(token),
     )
     assert renamed.status_code == 200
     renamed_data = renamed.json()
     assert renamed_data["old_path"] == "/Documents/note.txt"
     assert renamed_data["new_path"] == "/Documents/note2.txt"
 
-    moved = await client.post(
+    moved = await fs_client.post(
         "/api/v1/fs/move",
         json={"source_path": "/Documents/note2.txt", "dest_parent_path": "/Downloads"},
-        headers=_auth_headers(token),
     )
     assert moved.status_code == 200
     moved_data = moved.json()
     assert moved_data["new_path"] == "/Downloads/note2.txt"
 
 
-async def test_fs_copy_and_search(client: AsyncClient, beta_token_store: dict[str, str]):
-    token = await _register_and_login(client, "fs4@example.com", "fsuser4", beta_token_store)
-
-    await client.post(
-        "/api/v1/fs/node",
+async def test_fs_copy_and_search(fs_client: AsyncClient) -> None:
+    # Nodes are created in order, so readme.txt can target the directory made before it.
+    created = await fs_client.post(
+        "/api/v1/fs/bulk-create",
         json={
-            "parent_path": "/Documents",
-            "name": "Projects",
-            "node_type": "directory",
-        },
-        headers=_auth_headers(token),
-    )
-    await client.post(
-        "/api/v1/fs/node",
-        json={
-            "parent_path": "/Documents/Projects",
-            "name": "readme.txt",
-            "node_type": "file",
-            "size": 3,
+            "nodes": [
+                {"parent_path": "/Documents", "name": "Projects", "node_type": "directory"},
+                {
+                    "parent_path": "/Documents/Projects",
+                    "name": "readme.txt",
+                    "node_type": "file",
+                    "size": 3,
+                },
+            ]
         },
-        headers=_auth_headers(token),
     )
+    assert created.status_code == 200
+    assert created.json()["failed"] == []
 
-    copied = await client.post(
+    copied = await fs_client.post(
         "/api/v1/fs/copy",
         json={"source_path": "/Documents/Projects", "dest_parent_path": "/Desktop"},
-        headers=_auth_headers(token),
     )
     assert copied.status_code == 200
     new_root = copied.json()["new_path"]
     assert new_root == "/Desktop/Projects"
 
-    copied_file = await client.get(
-        "/api/v1/fs/node",
-        params={"path": f"{new_root}/readme.txt"},
-        headers=_auth_headers(token),
-    )
+    copied_file = await fs_client.get("/api/v1/fs/node", params={"path": f"{new_root}/readme.txt"})
     assert copied_file.status_code == 200
 
-    search = await client.get(
-        "/api/v1/fs/search",
-        params={"q": "Projects"},
-        headers=_auth_headers(token),
-    )
+    search = await fs_client.get("/api/v1/fs/search", params={"q": "Projects"})
     assert search.status_code == 200
     paths = {item["path"] for item in search.json()}
     assert "/Documents/Projects" in paths
@@ -183,114 +166,104 @@ async def test_fs_copy_and_search(client: AsyncClient, beta_token_store: dict[st
 
 
 async def test_fs_delete_restore_and_empty_trash(
-    client: AsyncClient, beta_token_store: dict[str, str]
-):
-    token = await _register_and_login(client, "fs5@example.com", "fsuser5", beta_token_store)
-
-    await client.post(
-        "/api/v1/fs/node",
-        json={
-            "parent_path": "/Documents",
-            "name": "temp.txt",
-            "node_type": "file",
-        },
-        headers=_auth_headers(token),
-    )
+    fs_client: AsyncClient, fs_setup: _FsSetup
+) -> None:
+    await fs_setup.create_file("/Documents", "temp.txt")
 
-    deleted = await client.post(
+    deleted = await fs_client.post(
         "/api/v1/fs/delete",
         json={"path": "/Documents/temp.txt", "permanent": False},
-        headers=_auth_headers(token),
     )
     assert deleted.status_code == 200
     trashed_path = deleted.json()["path"]
     assert trashed_path.startswith("/.Trash/")
 
-    trash = await client.get("/api/v1/fs/trash", headers=_auth_headers(token))
+    trash = await fs_client.get("/api/v1/fs/trash")
     assert trash.status_code == 200
     trash_paths = {item["path"] for item in trash.json()}
     assert trashed_path in trash_paths
 
-    restored = await client.post(
-        "/api/v1/fs/restore",
-        json={"path": trashed_path},
-        headers=_auth_headers(token),
-    )
+    restored = await fs_client.post("/api/v1/fs/restore", json={"path": trashed_path})
     assert restored.status_code == 200
     assert restored.json()["new_path"] == "/Documents/temp.txt"
 
-    trash_after_restore = await client.get("/api/v1/fs/trash", headers=_auth_headers(token))
+    trash_after_restore = await fs_client.get("/api/v1/fs/trash")
     assert trash_after_restore.status_code == 200
     assert trash_after_restore.json() == []
 
-    await client.post(
-        "/api/v1/fs/node",
-        json={
-            "parent_path": "/Documents",
-            "name": "junk.txt",
-            "node_type": "file",
-        },
-        headers=_auth_headers(token),
-    )
-    await client.post(
+    await fs_setup.create_file("/Documents", "junk.txt")
+    await fs_client.post(
         "/api/v1/fs/delete",
         json={"path": "/Documents/junk.txt", "permanent": False},
-        headers=_auth_headers(token),
     )
 
-    emptied = await client.post("/api/v1/fs/empty-trash", headers=_auth_headers(token))
+    emptied = await fs_client.post("/api/v1/fs/empty-trash")
     assert emptied.status_code == 200
     assert emptied.json()["deleted"] >= 1
 
-    trash_after_empty = await client.get("/api/v1/fs/trash", headers=_auth_headers(token))
+    trash_after_empty = await fs_client.get("/api/v1/fs/trash")
     assert trash_after_empty.status_code == 200
     assert trash_after_empty.json() == []
 
 
-async def test_fs_bulk_move_and_bulk_delete(client: AsyncClient, beta_token_store: dict[str, str]):
-    token = await _register_and_login(client, "fs6@example.com", "fsuser6", beta_token_store)
+async def test_fs_bulk_create(fs_client: AsyncClient) -> None:
+    created = await fs_client.post(
+        "/api/v1/fs/bulk-create",
+        json={
+            "nodes": [
+                {"parent_path": "/Documents", "name": "Batch", "node_type": "directory"},
+                {"parent_path": "/Documents/Batch", "name": "a.txt", "node_type": "file"},
+                {"parent_path": "/Documents/missing", "name": "b.txt", "node_type": "file"},
+            ]
+        },
+    )
+    assert created.status_code == 200
+    created_data = created.json()
+    assert created_data["succeeded"] == ["/Documents/Batch", "/Documents/Batch/a.txt"]
+    assert created_data["failed"] == [
+        {"path": "/Documents/missing/b.txt", "error": "Parent not found: /Documents/missing"}
+    ]
+
+    listing = await fs_client.get("/api/v1/fs/ls", params={"path": "/Documents/Batch"})
+    assert listing.status_code == 200
+    assert [child["name"] for child in listing.json()["children"]] == ["a.txt"]
+
 
-    for name in ["a.txt", "b.txt"]:
-        created = await client.post(
-            "/api/v1/fs/node",
-            json={
-                "parent_path": "/Documents",
-                "name": name,
-                "node_type": "file",
-            },
-            headers=_auth_headers(token),
-        )
-        assert created.status_code == 201
+async def test_fs_bulk_move_and_bulk_delete(fs_client: AsyncClient) -> None:
+    created = await fs_client.post(
+        "/api/v1/fs/bulk-create",
+        json={
+            "nodes": [
+                {"parent_path": "/Documents", "name": name, "node_type": "file"}
+                for name in ["a.txt", "b.txt"]
+            ]
+        },
+    )
+    assert created.status_code == 200
 
-    moved = await client.post(
+    moved = await fs_client.post(
         "/api/v1/fs/bulk-move",
         json={
             "source_paths": ["/Documents/a.txt", "/Documents/b.txt"],
             "dest_parent_path": "/Downloads",
         },
-        headers=_auth_headers(token),
     )
     assert moved.status_code == 200
     moved_data = moved.json()
     assert set(moved_data["succeeded"]) == {"/Documents/a.txt", "/Documents/b.txt"}
     assert moved_data["failed"] == []
 
-    downloads = await client.get(
-        "/api/v1/fs/ls",
-        params={"path": "/Downloads"},
-        headers=_auth_headers(token),
-    )
+    downloads = await fs_client.get("/api/v1/fs/ls", params={"path": "/Downloads"})
     assert downloads.status_code == 200
     download_names = {child["name"] for child in downloads.json()["children"]}
     assert {"a.txt", "b.txt"}.issubset(download_names)
 
-    bulk_deleted = await client.post(
+    bulk_deleted = await fs_client.post(
         "/api/v1/fs/bulk-delete",
         json={
             "paths": ["/Downloads/a.txt", "/Downloads/missing.txt"],
             "permanent": True,
         },
-        headers=_auth_headers(token),
     )
     assert bulk_deleted.status_code == 200
     deleted_data = bulk_deleted.json()
@@ -299,40 +272,15 @@ async def test_fs_bulk_move_and_bulk_delete(client: AsyncClient, beta_token_stor
         {"path": "/Downloads/missing.txt", "error": "Node not found: /Downloads/missing.txt"}
     ]
 
-    missing = await client.get(
-        "/api/v1/fs/node",
-        params={"path": "/Downloads/a.txt"},
-        headers=_auth_headers(token),
-    )
+    missing = await fs_client.get("/api/v1/fs/node", params={"path": "/Downloads/a.txt"})
     assert missing.status_code == 404
 
 
-async def test_fs_update_desktop_positions(client: AsyncClient, beta_token_store: dict[str, str]):
-    token = await _register_and_login(client, "fs7@example.com", "fsuser7", beta_token_store)
+async def test_fs_update_desktop_positions(fs_client: AsyncClient, fs_setup: _FsSetup) -> None:
+    await fs_setup.create_file("/Desktop", "alpha.txt")
+    await fs_setup.create_file("/Desktop", "beta.txt")
 
-    created_one = await client.post(
-        "/api/v1/fs/node",
-        json={
-            "parent_path": "/Desktop",
-            "name": "alpha.txt",
-            "node_type": "file",
-        },
-        headers=_auth_headers(token),
-    )
-    assert created_one.status_code == 201
-
-    created_two = await client.post(
-        "/api/v1/fs/node",
-        json={
-            "parent_path": "/Desktop",
-            "name": "beta.txt",
-            "node_type": "file",
-        },
-        headers=_auth_headers(token),
-    )
-    assert created_two.status_code == 201
-
-    updated = await client.patch(
+    updated = await fs_client.patch(
         "/api/v1/fs/desktop-positions",
         json={
             "positions": [
@@ -340,7 +288,6 @@ async def test_fs_update_desktop_positions(client: AsyncClient, beta_token_store
                 {"path": "/Desktop/beta.txt", "x": 12, "y": 34},
             ]
         },
-        headers=_auth_headers(token),
     )
     assert updated.status_code == 200
     updated_data = updated.json()
@@ -349,34 +296,24 @@ async def test_fs_update_desktop_positions(client: AsyncClient, beta_token_store
     assert positions["/Desktop/alpha.txt"] == (120, 240)
     assert positions["/Desktop/beta.txt"] == (12, 34)
 
-    alpha = await client.get(
-        "/api/v1/fs/node",
-        params={"path": "/Desktop/alpha.txt"},
-        headers=_auth_headers(token),
-    )
+    alpha = await fs_client.get("/api/v1/fs/node", params={"path": "/Desktop/alpha.txt"})
     assert alpha.status_code == 200
-    assert (alpha.json()["desktop_x"], alpha.json()["desktop_y"]) == (120, 240)
-
+    alpha_data = alpha.json()
+    assert (alpha_data["desktop_x"], alpha_data["desktop_y"]) == (120, 240)
 
-async def test_fs_write_and_read_file(client: AsyncClient, beta_token_store: dict[str, str]):
-    token = await _register_and_login(client, "fs8@example.com", "fsuser8", beta_token_store)
 
+async def test_fs_write_and_read_file(fs_client: AsyncClient) -> None:
     content = "Salom, dunyo!"
-    write = await client.post(
+    write = await fs_client.post(
         "/api/v1/fs/write",
         json={"path": "/Documents/hello.txt", "content": content},
-        headers=_auth_headers(token),
     )
     assert write.status_code == 200
     write_data = write.json()
     assert write_data["path"] == "/Documents/hello.txt"
     assert write_data["size"] == len(content.encode("utf-8"))
 
-    read = await client.get(
-        "/api/v1/fs/read",
-        params={"path": "/Documents/hello.txt"},
-        headers=_auth_headers(token),
-    )
+    read = await fs_client.get("/api/v1/fs/read", params={"path": "/Documents/hello.txt"})
     assert read.status_code == 200
     read_data = read.json()
     assert read_data["content"] == content
@@ -384,14 +321,12 @@ async def test_fs_write_and_read_file(client: AsyncClient, beta_token_store: dic
     assert read_data["encoding"] == "utf-8"
 
 
-async def test_fs_read_missing_file_returns_404(
-    client: AsyncClient, beta_token_store: dict[str, str]
-):
-    token = await _register_and_login(client, "fs9@example.com", "fsuser9", beta_token_store)
-
-    missing = await client.get(
-        "/api/v1/fs/read",
-        params={"path": "/Documents/missing.txt"},
-        headers=_auth_headers(token),
-    )
+async def test_fs_read_missing_file_returns_404(fs_client: AsyncClient) -> None:
+    missing = await fs_client.get("/api/v1/fs/read", params={"path": "/Documents/missing.txt"})
     assert missing.status_code == 404
+
+
+async def test_fs_path_traversal_returns_400(fs_client: AsyncClient) -> None:
+    response = await fs_client.get("/api/v1/fs/node", params={"path": "/Documents/../etc/passwd"})
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Path must not contain '..' segments"}
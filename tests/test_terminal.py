@@ -9,28 +9,116 @@ from __future__ import annotations
 import asyncio
 import json
 import socket
+import threading
 import time
 import uuid
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, nullcontext
+from types import SimpleNamespace
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from starlette.testclient import TestClient, WebSocketTestSession
 
 from aiso_core.config import settings
+from aiso_core.main import app
 from aiso_core.models.user import User
+from aiso_core.services import terminal_service as _ts
 from aiso_core.services.terminal_service import TerminalSession, _extract_socket
 from aiso_core.utils.security import create_access_token
 
+# ── Helpers ──
+
+
+def _wait_for(pred: Callable[[], bool], timeout: float = 2.0, step: float = 0.005) -> None:
+    """Poll until pred() holds — the WS server runs in TestClient's portal thread."""
+    deadline = time.monotonic() + timeout
+    while not pred():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met within timeout")
+        time.sleep(step)
+
+
+class _FakeTerminalSession:
+    """Stand-in for TerminalSession — echoes writes back, answers Enter with a prompt."""
+
+    def __init__(self) -> None:
+        self.session_id = "test-session-123"
+        self.is_closed = False
+        self.resize_calls: list[tuple[int, int]] = []
+        self._pending: deque[bytes] = deque([b"aisu@aisu:~$ "])
+        self._readable = asyncio.Event()
+
+    async def start(self) -> None:
+        pass
+
+    async def read(self, size: int = 4096) -> bytes:
+        while not self._pending and not self.is_closed:
+            self._readable.clear()
+            try:
+                await asyncio.wait_for(self._readable.wait(), timeout=30.0)
+            except TimeoutError:
+                return b""
+        if self.is_closed:
+            return b""
+        return self._pending.popleft()
+
+    async def write(self, data: bytes) -> None:
+        if not self.is_closed:
+            self._pending.append(data)
+            if data == b"\r" or data.endswith(b"\n"):
+                self._pending.append(b"\r\naisu@aisu:~$ ")
+            self._readable.set()
+
+    async def resize(self, rows: int, cols: int) -> None:
+        self.resize_calls.append((rows, cols))
+
+    async def close(self) -> None:
+        self.is_closed = True
+
+
+class _FakeSock:
+    """Just the socket surface TerminalSession touches — _extract_socket takes it via fileno."""
+
+    __slots__ = ("recv", "sendall")
+
+    def __init__(self, recv: Callable[[int], bytes]) -> None:
+        self.recv = recv
+        self.sendall = MagicMock()
+
+    def fileno(self) -> int:
+        return 5
+
+    def settimeout(self, timeout: float | None) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def _recv_reset(size: int) -> bytes:
+    raise OSError("Connection reset")
+
+
+def _drain_preamble(ws: WebSocketTestSession) -> tuple[dict[str, Any], dict[str, Any], bytes]:
+    """Read what the endpoint sends before any input: status, ready, first prompt."""
+    return ws.receive_json(), ws.receive_json(), ws.receive_bytes()
+
+
 # ── Fixtures ──
 
 
 @pytest.fixture
-def mock_socket() -> MagicMock:
+def mock_socket(request: pytest.FixtureRequest) -> _FakeSock:
     """Mock socket — simulates recv() and sendall()."""
-    sock = MagicMock(spec=socket.socket)
-    sock.fileno.return_value = 5
     recv_data = [b"aisu@aisu:~$ "]
     call_count = 0
+    # Once the data runs out recv() blocks like a quiet socket until teardown
+    stop = threading.Event()
+    request.addfinalizer(stop.set)
 
     def mock_recv(size: int) -> bytes:
         nonlocal call_count
@@ -38,17 +126,14 @@ def mock_socket() -> MagicMock:
             data = recv_data[call_count]
             call_count += 1
             return data
-        time.sleep(100)
+        stop.wait()
         return b""
 
-    sock.recv = mock_recv
-    sock.sendall = MagicMock()
-    sock.settimeout = MagicMock()
-    return sock
+    return _FakeSock(mock_recv)
 
 
 @pytest.fixture
-def mock_docker_client(mock_socket: MagicMock) -> MagicMock:
+def mock_docker_client(mock_socket: _FakeSock) -> MagicMock:
     """Mock Docker client — simulates the screen stream."""
     client = MagicMock()
 
@@ -80,9 +165,7 @@ def mock_docker_client(mock_socket: MagicMock) -> MagicMock:
 
     client.api.exec_resize.return_value = None
 
-    container_mock = MagicMock()
-    container_mock.status = "running"
-    client.containers.get.return_value = container_mock
+    client.containers.get.return_value = SimpleNamespace(status="running")
 
     return client
 
@@ -91,54 +174,57 @@ def mock_docker_client(mock_socket: MagicMock) -> MagicMock:
 
 
 class TestTerminalSession:
+    @pytest.fixture(autouse=True)
+    def _patch_docker_client(
+        self, monkeypatch: pytest.MonkeyPatch, mock_docker_client: MagicMock
+    ) -> None:
+        monkeypatch.setattr(_ts, "_get_docker_client", lambda: mock_docker_client)
+
     async def test_start_creates_screen_and_attaches(
         self,
         mock_docker_client: MagicMock,
-        mock_socket: MagicMock,
+        mock_socket: _FakeSock,
     ) -> None:
-        with patch(
-            "aiso_core.services.terminal_service._get_docker_client",
-            return_value=mock_docker_client,
-        ):
-            session = TerminalSession("aisu_test")
-            await session.start()
-
-            assert session._exec_id == "exec_screen_attach_456"
-            assert session._raw_socket is mock_socket
-            assert not session.is_closed
-
-            # exec_create should be called 4 times
-            # (screenrc + screen -ls + screen create + screen attach)
-            assert mock_docker_client.api.exec_create.call_count == 4
-
-            # First — screenrc setup (bash -c ...)
-            first_call = mock_docker_client.api.exec_create.call_args_list[0]
-            first_cmd = first_call[1]["cmd"]
-            assert first_cmd[0] == "bash"
-            assert first_cmd[1] == "-c"
-
-            # Second — screen -ls (check for existing session)
-            second_call = mock_docker_client.api.exec_create.call_args_list[1]
-            second_cmd = second_call[1]["cmd"]
-            assert second_cmd[0] == "screen"
-            assert "-ls" in second_cmd
-
-            # Third — screen -dmS (create session)
-            third_call = mock_docker_client.api.exec_create.call_args_list[2]
-            third_cmd = third_call[1]["cmd"]
-            assert third_cmd[0] == "screen"
-            assert "-dmS" in third_cmd
-
-            # Fourth — screen -d -r (attach)
-            fourth_call = mock_docker_client.api.exec_create.call_args_list[3]
-            fourth_cmd = fourth_call[1]["cmd"]
-            assert fourth_cmd[0] == "screen"
-            assert "-d" in fourth_cmd
-            assert "-r" in fourth_cmd
+        session = TerminalSession("aisu_test")
+        await session.start()
+
+        assert session._exec_id == "exec_screen_attach_456"
+        assert session._raw_socket is mock_socket
+        assert not session.is_closed
+
+        # exec_create should be called 4 times
+        # (screenrc + screen -ls + screen create + screen attach)
+        assert mock_docker_client.api.exec_create.call_count == 4
+
+        # First — screenrc setup (bash -c ...)
+        first_call = mock_docker_client.api.exec_create.call_args_list[0]
+        first_cmd = first_call[1]["cmd"]
+        assert first_cmd[0] == "bash"
+        assert first_cmd[1] == "-c"
+
+        # Second — screen -ls (check for existing session)
+        second_call = mock_docker_client.api.exec_create.call_args_list[1]
+        second_cmd = second_call[1]["cmd"]
+        assert second_cmd[0] == "screen"
+        assert "-ls" in second_cmd
+
+        # Third — screen -dmS (create session)
+        third_call = mock_docker_client.api.exec_create.call_args_list[2]
+        third_cmd = third_call[1]["cmd"]
+        assert third_cmd[0] == "screen"
+        assert "-dmS" in third_cmd
+
+        # Fourth — screen -d -r (attach)
+        fourth_call = mock_docker_client.api.exec_create.call_args_list[3]
+        fourth_cmd = fourth_call[1]["cmd"]
+        assert fourth_cmd[0] == "screen"
+        assert "-d" in fourth_cmd
+        assert "-r" in fourth_cmd
 
     async def test_start_attaches_existing_session_without_creating_new_one(
         self,
-        mock_socket: MagicMock,
+        mock_socket: _FakeSock,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         client = MagicMock()
         socket_wrapper = MagicMock()
@@ -156,11 +242,8 @@ class TestTerminalSession:
             socket_wrapper,
         ]
 
-        with patch(
-            "aiso_core.services.terminal_service._get_docker_client",
-            return_value=client,
-        ):
-            await session.start()
+        monkeypatch.setattr(_ts, "_get_docker_client", lambda: client)
+        await session.start()
 
         called_cmds = [call[1]["cmd"] for call in client.api.exec_create.call_args_list]
         assert len(called_cmds) == 3
@@ -168,105 +251,67 @@ class TestTerminalSession:
         assert "-d" in called_cmds[2]
         assert "-r" in called_cmds[2]
 
-    async def test_read_returns_data(
-        self,
-        mock_docker_client: MagicMock,
-    ) -> None:
-        with patch(
-            "aiso_core.services.terminal_service._get_docker_client",
-            return_value=mock_docker_client,
-        ):
-            session = TerminalSession("aisu_test")
-            await session.start()
+    async def test_read_returns_data(self) -> None:
+        session = TerminalSession("aisu_test")
+        await session.start()
 
-            data = await session.read()
-            assert data == b"aisu@aisu:~$ "
+        data = await session.read()
+        assert data == b"aisu@aisu:~$ "
 
     async def test_write_sends_data(
         self,
-        mock_docker_client: MagicMock,
-        mock_socket: MagicMock,
+        mock_socket: _FakeSock,
     ) -> None:
-        with patch(
-            "aiso_core.services.terminal_service._get_docker_client",
-            return_value=mock_docker_client,
-        ):
-            session = TerminalSession("aisu_test")
-            await session.start()
+        session = TerminalSession("aisu_test")
+        await session.start()
 
-            await session.write(b"ls\n")
-            mock_socket.sendall.assert_called_once_with(b"ls\n")
+        await session.write(b"ls\n")
+        mock_socket.sendall.assert_called_once_with(b"ls\n")
 
     async def test_write_after_close_is_noop(
         self,
-        mock_docker_client: MagicMock,
-        mock_socket: MagicMock,
+        mock_socket: _FakeSock,
     ) -> None:
-        with patch(
-            "aiso_core.services.terminal_service._get_docker_client",
-            return_value=mock_docker_client,
-        ):
-            session = TerminalSession("aisu_test")
-            await session.start()
-            await session.close()
+        session = TerminalSession("aisu_test")
+        await session.start()
+        await session.close()
 
-            await session.write(b"ls\n")
-            mock_socket.sendall.assert_not_called()
+        await session.write(b"ls\n")
+        mock_socket.sendall.assert_not_called()
 
-    async def test_read_after_close_returns_empty(
-        self,
-        mock_docker_client: MagicMock,
-    ) -> None:
-        with patch(
-            "aiso_core.services.terminal_service._get_docker_client",
-            return_value=mock_docker_client,
-        ):
-            session = TerminalSession("aisu_test")
-            await session.start()
-            await session.close()
+    async def test_read_after_close_returns_empty(self) -> None:
+        session = TerminalSession("aisu_test")
+        await session.start()
+        await session.close()
 
-            data = await session.read()
-            assert data == b""
+        data = await session.read()
+        assert data == b""
 
-    async def test_close_is_idempotent(
-        self,
-        mock_docker_client: MagicMock,
-    ) -> None:
-        with patch(
-            "aiso_core.services.terminal_service._get_docker_client",
-            return_value=mock_docker_client,
-        ):
-            session = TerminalSession("aisu_test")
-            await session.start()
-            await session.close()
-            await session.close()
-            assert session.is_closed
+    async def test_close_is_idempotent(self) -> None:
+        session = TerminalSession("aisu_test")
+        await session.start()
+        await session.close()
+        await session.close()
+        assert session.is_closed
 
     async def test_resize_calls_docker_api(
         self,
         mock_docker_client: MagicMock,
     ) -> None:
-        with patch(
-            "aiso_core.services.terminal_service._get_docker_client",
-            return_value=mock_docker_client,
-        ):
-            session = TerminalSession("aisu_test")
-            await session.start()
+        session = TerminalSession("aisu_test")
+        await session.start()
 
-            await session.resize(40, 120)
-            mock_docker_client.api.exec_resize.assert_called_once_with(
-                "exec_screen_attach_456",
-                height=40,
-                width=120,
-            )
+        await session.resize(40, 120)
+        mock_docker_client.api.exec_resize.assert_called_once_with(
+            "exec_screen_attach_456",
+            height=40,
+            width=120,
+        )
 
-    async def test_read_oserror_when_closed_returns_empty(
-        self,
-        mock_docker_client: MagicMock,
-    ) -> None:
-        bad_socket = MagicMock(spec=socket.socket)
-        bad_socket.recv.side_effect = OSError("Connection reset")
-        bad_socket.settimeout = MagicMock()
+    @pytest.fixture
+    def bad_socket(self, mock_docker_client: MagicMock) -> _FakeSock:
+        """Socket whose recv() fails with a connection reset, served by start()."""
+        bad_socket = _FakeSock(_recv_reset)
 
         socket_wrapper = MagicMock()
         socket_wrapper._sock = bad_socket
@@ -282,50 +327,28 @@ class TestTerminalSession:
             {"Id": "e3"},
             {"Id": "e4"},
         ]
+        return bad_socket
 
-        with patch(
-            "aiso_core.services.terminal_service._get_docker_client",
-            return_value=mock_docker_client,
-        ):
-            session = TerminalSession("aisu_test")
-            await session.start()
-            session._closed = True
-
-            data = await session.read()
-            assert data == b""
-
-    async def test_read_oserror_when_open_raises(
+    @pytest.mark.parametrize(
+        ("closed", "expectation"),
+        [
+            (True, nullcontext()),
+            (False, pytest.raises(OSError, match="Connection reset")),
+        ],
+        ids=["closed_returns_empty", "open_raises"],
+    )
+    async def test_read_oserror(
         self,
-        mock_docker_client: MagicMock,
+        bad_socket: _FakeSock,
+        closed: bool,
+        expectation: AbstractContextManager[object],
     ) -> None:
-        bad_socket = MagicMock(spec=socket.socket)
-        bad_socket.recv.side_effect = OSError("Connection reset")
-        bad_socket.settimeout = MagicMock()
-
-        socket_wrapper = MagicMock()
-        socket_wrapper._sock = bad_socket
-        mock_docker_client.api.exec_start.side_effect = [
-            b"",
-            b"No Sockets found.",
-            b"",
-            socket_wrapper,
-        ]
-        mock_docker_client.api.exec_create.side_effect = [
-            {"Id": "e1"},
-            {"Id": "e2"},
-            {"Id": "e3"},
-            {"Id": "e4"},
-        ]
+        session = TerminalSession("aisu_test")
+        await session.start()
+        session._closed = closed
 
-        with patch(
-            "aiso_core.services.terminal_service._get_docker_client",
-            return_value=mock_docker_client,
-        ):
-            session = TerminalSession("aisu_test")
-            await session.start()
-
-            with pytest.raises(OSError, match="Connection reset"):
-                await session.read()
+        with expectation:
+            assert await session.read() == b""
 
     async def test_session_id_is_unique(self) -> None:
         s1 = TerminalSession("c1")
@@ -349,17 +372,18 @@ class TestTerminalSession:
             {"Id": "e_check"},
             {"Id": "e_create"},
         ]
-        mock_docker_client.api.exec_start.side_effect = [b"", b"No Sockets found.", b"no screen running"]
+        mock_docker_client.api.exec_start.side_effect = [
+            b"",
+            b"No Sockets found.",
+            b"no screen running",
+        ]
 
-        with patch(
-            "aiso_core.services.terminal_service._get_docker_client",
-            return_value=mock_docker_client,
-        ):
-            session = TerminalSession("aisu_test")
-            with pytest.raises(RuntimeError, match="Failed to create screen session"):
-                await session.start()
+        session = TerminalSession("aisu_test")
+        with pytest.raises(RuntimeError, match="Failed to create screen session"):
+            await session.start()
 
 
+@pytest.mark.fast
 class TestExtractSocket:
     def test_extracts_from_sock_attribute(self) -> None:
         raw = MagicMock(spec=socket.socket)
@@ -396,6 +420,15 @@ class TestExtractSocket:
 class TestTerminalWebSocket:
     """Terminal WebSocket endpoint integration tests."""
 
+    @pytest.fixture(scope="class")
+    @classmethod
+    def ws_client(cls) -> Iterator[TestClient]:
+        """One TestClient per class — the app lifespan runs once, not per test."""
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(settings, "container_enabled", False)
+            with TestClient(app) as tc:
+                yield tc
+
     @pytest.fixture
     async def user_and_token(
         self,
@@ -414,294 +447,163 @@ class TestTerminalWebSocket:
         )
         db_session.add(user)
         await db_session.commit()
-        await db_session.refresh(user)
 
         token = create_access_token({"sub": str(user.id)})
         return user, token
 
     @pytest.fixture
-    def mock_terminal_session(self) -> MagicMock:
-        """Stable mock TerminalSession."""
-        session = AsyncMock(spec=TerminalSession)
-        session.session_id = "test-session-123"
-        session.is_closed = False
-
-        read_queue: asyncio.Queue[bytes] = asyncio.Queue()
-        read_queue.put_nowait(b"aisu@aisu:~$ ")
-
-        async def mock_read(size: int = 4096) -> bytes:
-            if session.is_closed:
-                return b""
-            try:
-                return await asyncio.wait_for(read_queue.get(), timeout=30.0)
-            except TimeoutError:
-                return b""
-
-        session.read = mock_read
-
-        async def mock_write(data: bytes) -> None:
-            if not session.is_closed:
-                await read_queue.put(data)
-                if data == b"\r" or data.endswith(b"\n"):
-                    await read_queue.put(b"\r\naisu@aisu:~$ ")
-
-        session.write = mock_write
-        session.start = AsyncMock()
-        session.close = AsyncMock()
-        session.resize = AsyncMock()
-        session._read_queue = read_queue
-        return session
-
-    def _setup_ws_test(
-        self,
-        async_session_factory: async_sessionmaker[AsyncSession],
-        mock_terminal_session: MagicMock,
-        monkeypatch: pytest.MonkeyPatch,
-    ):
-        """Common setup for WebSocket tests — monkeypatch + mock."""
-        from aiso_core.main import app
-
-        monkeypatch.setattr(settings, "container_enabled", False)
-
-        monkeypatch.setattr(
-            "aiso_core.api.v1.terminal.async_session_factory",
-            async_session_factory,
-        )
+    def mock_terminal_session(self) -> _FakeTerminalSession:
+        return _FakeTerminalSession()
 
+    @pytest.fixture(scope="class")
+    @classmethod
+    def terminal_session_cls(cls) -> Iterator[MagicMock]:
+        """Patch the endpoint's container and terminal dependencies once per class."""
         mock_container_instance = AsyncMock()
         mock_container_instance.start_container.return_value = {
             "status": "running",
             "message": "ok",
         }
 
-        mock_docker_container = MagicMock()
-        mock_docker_container.status = "running"
         mock_docker_client_obj = MagicMock()
-        mock_docker_client_obj.containers.get.return_value = mock_docker_container
+        mock_docker_client_obj.containers.get.return_value = SimpleNamespace(status="running")
 
-        patches = [
+        with (
             patch(
                 "aiso_core.api.v1.terminal.ContainerService",
                 return_value=mock_container_instance,
             ),
-            patch(
-                "aiso_core.api.v1.terminal.TerminalSession",
-                return_value=mock_terminal_session,
-            ),
             patch(
                 "aiso_core.api.v1.terminal._get_docker_client",
                 return_value=mock_docker_client_obj,
             ),
-        ]
-        return app, patches
+            patch("aiso_core.api.v1.terminal.TerminalSession") as terminal_session_cls,
+        ):
+            yield terminal_session_cls
 
-    async def test_no_token_rejects(
+    @pytest.fixture(autouse=True)
+    def _setup_ws_test(
         self,
+        terminal_session_cls: MagicMock,
         async_session_factory: async_sessionmaker[AsyncSession],
+        mock_terminal_session: _FakeTerminalSession,
         monkeypatch: pytest.MonkeyPatch,
     ) -> None:
-        from starlette.testclient import TestClient
-
-        from aiso_core.main import app
-
-        monkeypatch.setattr(settings, "container_enabled", False)
+        """Point the shared patches at this test's DB session and fake terminal."""
         monkeypatch.setattr(
             "aiso_core.api.v1.terminal.async_session_factory",
             async_session_factory,
         )
+        terminal_session_cls.reset_mock()
+        terminal_session_cls.return_value = mock_terminal_session
 
-        with TestClient(app) as tc, pytest.raises(Exception):
-            with tc.websocket_connect("/ws/terminal"):
-                pass
-
-    async def test_invalid_token_rejects(
-        self,
-        async_session_factory: async_sessionmaker[AsyncSession],
-        monkeypatch: pytest.MonkeyPatch,
-    ) -> None:
-        from starlette.testclient import TestClient
-
-        from aiso_core.main import app
-
-        monkeypatch.setattr(settings, "container_enabled", False)
-        monkeypatch.setattr(
-            "aiso_core.api.v1.terminal.async_session_factory",
-            async_session_factory,
-        )
+    async def test_no_token_rejects(self, ws_client: TestClient) -> None:
+        with pytest.raises(Exception), ws_client.websocket_connect("/ws/terminal"):
+            pass
 
-        with TestClient(app) as tc, pytest.raises(Exception):
-            with tc.websocket_connect("/ws/terminal?token=invalid_token"):
-                pass
+    async def test_invalid_token_rejects(self, ws_client: TestClient) -> None:
+        with (
+            pytest.raises(Exception),
+            ws_client.websocket_connect("/ws/terminal?token=invalid_token"),
+        ):
+            pass
 
     async def test_full_session_lifecycle(
         self,
+        ws_client: TestClient,
         user_and_token: tuple[User, str],
-        async_session_factory: async_sessionmaker[AsyncSession],
-        mock_terminal_session: MagicMock,
-        monkeypatch: pytest.MonkeyPatch,
+        mock_terminal_session: _FakeTerminalSession,
     ) -> None:
         """Full session: connect → ready → input → output → disconnect."""
         _, token = user_and_token
-        app, patches = self._setup_ws_test(
-            async_session_factory,
-            mock_terminal_session,
-            monkeypatch,
-        )
-
-        from starlette.testclient import TestClient
 
-        with patches[0], patches[1], patches[2], TestClient(app) as tc:
-            with tc.websocket_connect(f"/ws/terminal?token={token}") as ws:
-                msg1 = ws.receive_json()
-                assert msg1["type"] == "status"
-                assert msg1["status"] == "starting-container"
+        with ws_client.websocket_connect(f"/ws/terminal?token={token}") as ws:
+            msg1, msg2, prompt = _drain_preamble(ws)
+            assert msg1["type"] == "status"
+            assert msg1["status"] == "starting-container"
 
-                msg2 = ws.receive_json()
-                assert msg2["type"] == "ready"
-                assert "sessionId" in msg2
+            assert msg2["type"] == "ready"
+            assert "sessionId" in msg2
 
-                prompt = ws.receive_bytes()
-                assert b"aisu" in prompt
+            assert b"aisu" in prompt
 
-                ws.send_bytes(b"l")
-                echo = ws.receive_bytes()
-                assert echo == b"l"
+            ws.send_bytes(b"l")
+            echo = ws.receive_bytes()
+            assert echo == b"l"
 
-                ws.send_text(json.dumps({"type": "resize", "rows": 40, "cols": 120}))
-                time.sleep(0.1)
-                mock_terminal_session.resize.assert_called_with(40, 120)
+            ws.send_text(json.dumps({"type": "resize", "rows": 40, "cols": 120}))
+            _wait_for(lambda: bool(mock_terminal_session.resize_calls))
+            assert mock_terminal_session.resize_calls == [(40, 120)]
 
     async def test_ws_passes_session_id_to_terminal_session(
         self,
+        ws_client: TestClient,
         user_and_token: tuple[User, str],
-        async_session_factory: async_sessionmaker[AsyncSession],
-        mock_terminal_session: MagicMock,
-        monkeypatch: pytest.MonkeyPatch,
+        terminal_session_cls: MagicMock,
     ) -> None:
         _, token = user_and_token
-        from starlette.testclient import TestClient
 
-        from aiso_core.main import app
+        with ws_client.websocket_connect(
+            f"/ws/terminal?token={token}&session_id=persist-001"
+        ) as ws:
+            ws.receive_json()  # status
+            ws.receive_json()  # ready
 
-        monkeypatch.setattr(settings, "container_enabled", False)
-        monkeypatch.setattr(
-            "aiso_core.api.v1.terminal.async_session_factory",
-            async_session_factory,
+        expected_container_name = f"aisu_{user_and_token[0].id}"
+        terminal_session_cls.assert_called_once_with(
+            expected_container_name,
+            session_id="persist-001",
         )
 
-        mock_container_instance = AsyncMock()
-        mock_container_instance.start_container.return_value = {
-            "status": "running",
-            "message": "ok",
-        }
-
-        with (
-            patch(
-                "aiso_core.api.v1.terminal.ContainerService",
-                return_value=mock_container_instance,
-            ),
-            patch(
-                "aiso_core.api.v1.terminal.TerminalSession",
-                return_value=mock_terminal_session,
-            ) as terminal_session_cls,
-            TestClient(app) as tc,
-        ):
-            with tc.websocket_connect(f"/ws/terminal?token={token}&session_id=persist-001") as ws:
-                ws.receive_json()  # status
-                ws.receive_json()  # ready
-
-            expected_container_name = f"aisu_{user_and_token[0].id}"
-            terminal_session_cls.assert_called_once_with(
-                expected_container_name,
-                session_id="persist-001",
-            )
-
     async def test_session_survives_idle_period(
         self,
+        ws_client: TestClient,
         user_and_token: tuple[User, str],
-        async_session_factory: async_sessionmaker[AsyncSession],
-        mock_terminal_session: MagicMock,
-        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Session should not disconnect during idle period."""
         _, token = user_and_token
-        app, patches = self._setup_ws_test(
-            async_session_factory,
-            mock_terminal_session,
-            monkeypatch,
-        )
-
-        from starlette.testclient import TestClient
 
-        with patches[0], patches[1], patches[2], TestClient(app) as tc:
-            with tc.websocket_connect(f"/ws/terminal?token={token}") as ws:
-                ws.receive_json()  # status
-                ws.receive_json()  # ready
-                ws.receive_bytes()  # prompt
+        with ws_client.websocket_connect(f"/ws/terminal?token={token}") as ws:
+            _drain_preamble(ws)
 
-                time.sleep(1.0)
-
-                ws.send_bytes(b"w")
-                echo = ws.receive_bytes()
-                assert echo == b"w"
+            ws.send_bytes(b"w")
+            echo = ws.receive_bytes()
+            assert echo == b"w"
 
     async def test_enter_command_returns_output(
         self,
+        ws_client: TestClient,
         user_and_token: tuple[User, str],
-        async_session_factory: async_sessionmaker[AsyncSession],
-        mock_terminal_session: MagicMock,
-        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Should return command output when Enter is pressed."""
         _, token = user_and_token
-        app, patches = self._setup_ws_test(
-            async_session_factory,
-            mock_terminal_session,
-            monkeypatch,
-        )
-
-        from starlette.testclient import TestClient
 
-        with patches[0], patches[1], patches[2], TestClient(app) as tc:
-            with tc.websocket_connect(f"/ws/terminal?token={token}") as ws:
-                ws.receive_json()  # status
-                ws.receive_json()  # ready
-                ws.receive_bytes()  # prompt
+        with ws_client.websocket_connect(f"/ws/terminal?token={token}") as ws:
+            _drain_preamble(ws)
 
-                ws.send_bytes(b"\r")
-                echo1 = ws.receive_bytes()
-                assert echo1 == b"\r"
+            ws.send_bytes(b"\r")
+            echo1 = ws.receive_bytes()
+            assert echo1 == b"\r"
 
-                output = ws.receive_bytes()
-                assert b"aisu@aisu:~$" in output
+            output = ws.receive_bytes()
+            assert b"aisu@aisu:~$" in output
 
     async def test_multiple_rapid_inputs(
         self,
+        ws_client: TestClient,
         user_and_token: tuple[User, str],
-        async_session_factory: async_sessionmaker[AsyncSession],
-        mock_terminal_session: MagicMock,
-        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """All data should be received even with rapid sequential input."""
         _, token = user_and_token
-        app, patches = self._setup_ws_test(
-            async_session_factory,
-            mock_terminal_session,
-            monkeypatch,
-        )
-
-        from starlette.testclient import TestClient
 
-        with patches[0], patches[1], patches[2], TestClient(app) as tc:
-            with tc.websocket_connect(f"/ws/terminal?token={token}") as ws:
-                ws.receive_json()  # status
-                ws.receive_json()  # ready
-                ws.receive_bytes()  # prompt
+        with ws_client.websocket_connect(f"/ws/terminal?token={token}") as ws:
+            _drain_preamble(ws)
 
-                for ch in b"helloworld":
-                    ws.send_bytes(bytes([ch]))
+            for ch in b"helloworld":
+                ws.send_bytes(bytes([ch]))
 
-                received = b""
-                for _ in range(10):
-                    received += ws.receive_bytes()
-                assert received == b"helloworld"
+            # Echoes may arrive one frame per byte or coalesced
+            received = b""
+            while len(received) < len(b"helloworld"):
+                received += ws.receive_bytes()
+            assert received == b"helloworld"